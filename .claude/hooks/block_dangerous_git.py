@@ -3,10 +3,36 @@
 
 from __future__ import annotations
 
-import json
 import re
 import sys
 
+from hook_input import read_tool_input
+
+# Matches a dangerous git command at the start of the command or after a command
+# separator (&&, ||, ;). Both checks share the same prefix, so they are fused into a
+# single alternation compiled once at import time; the named group that matched
+# identifies which operation was found.
+# - reset: git reset --hard
+# - push: git push --force, git push -f, git push --force-with-lease
+_DANGEROUS_GIT_PATTERN = re.compile(
+    r"(?:^|&&|\|\||;)\s*git\s+"
+    r"(?:(?P<reset>reset\s+--hard\b)|(?P<push>push\s+.*(?:-f\b|--force\b|--force-with-lease\b)))"
+)
+
+_BLOCK_REASONS = {
+    "reset": "git reset --hard discards uncommitted changes and is destructive",
+    "push": "git push --force can overwrite remote history and cause data loss",
+}
+
+# Constant tail of the blocking message, appended after the specific reason
+_BLOCK_MESSAGE_SUFFIX = (
+    "\n\n"
+    "This hook prevents:\n"
+    "  - git reset --hard (data loss)\n"
+    "  - git push --force (overwrites remote history)\n\n"
+    "If you need to run these commands, ask the user to run them manually.\n"
+)
+
 
 def is_dangerous_command(command: str) -> tuple[bool, str | None]:
     """Check if a git command is dangerous and should be blocked.
@@ -19,17 +45,15 @@ def is_dangerous_command(command: str) -> tuple[bool, str | None]:
         - is_dangerous: True if command should be blocked
         - reason: Description of why it's blocked, or None if safe
     """
-    # Pattern for git reset --hard at start of command or after command separator
-    # Matches: ^git reset --hard, or after &&, ||, ; with optional whitespace
-    if re.search(r"(^|&&|\|\||;)\s*git\s+reset\s+--hard\b", command):
-        return True, "git reset --hard discards uncommitted changes and is destructive"
+    # Most commands never mention git; a substring check is far cheaper than the regex
+    if "git" not in command:
+        return False, None
 
-    # Pattern for git push --force (and variants) at start of command or after command separator
-    # Matches: git push --force, git push -f, git push --force-with-lease
-    if re.search(r"(^|&&|\|\||;)\s*git\s+push\s+.*(-f\b|--force\b|--force-with-lease\b)", command):
-        return True, "git push --force can overwrite remote history and cause data loss"
+    match = _DANGEROUS_GIT_PATTERN.search(command)
+    if match is None or match.lastgroup is None:
+        return False, None
 
-    return False, None
+    return True, _BLOCK_REASONS[match.lastgroup]
 
 
 def format_error_message(reason: str) -> str:
@@ -41,13 +65,7 @@ def format_error_message(reason: str) -> str:
     Returns:
         A formatted error message with helpful context
     """
-    return (
-        f"BLOCKED: Dangerous git command detected. {reason}\n\n"
-        "This hook prevents:\n"
-        "  - git reset --hard (data loss)\n"
-        "  - git push --force (overwrites remote history)\n\n"
-        "If you need to run these commands, ask the user to run them manually.\n"
-    )
+    return f"BLOCKED: Dangerous git command detected. {reason}{_BLOCK_MESSAGE_SUFFIX}"
 
 
 def main() -> None:
@@ -57,13 +75,8 @@ def main() -> None:
     It receives JSON data via stdin containing tool information.
     """
     # Read hook data from stdin
-    try:
-        hook_data = json.load(sys.stdin)
-        tool_input = hook_data.get("tool_input", {})
-        command = tool_input.get("command", "")
-    except (json.JSONDecodeError, KeyError):
-        # Invalid JSON or missing fields - don't block
-        sys.exit(0)
+    tool_input = read_tool_input()
+    command = tool_input.get("command", "")
 
     # Check if command is dangerous
     is_dangerous, reason = is_dangerous_command(command)
@@ -1,19 +1,16 @@
 #!/usr/bin/env python3
 """Block edits to dev-diary.txt file."""
 
-import json
 import sys
 
+from hook_input import read_tool_input
+
 
 def main() -> None:
     """Check if attempting to edit dev-diary.txt and block if so."""
     # Read hook data from stdin
-    try:
-        hook_data = json.load(sys.stdin)
-        tool_input = hook_data.get("tool_input", {})
-        file_path = tool_input.get("file_path", "")
-    except (json.JSONDecodeError, KeyError):
-        sys.exit(0)
+    tool_input = read_tool_input()
+    file_path = tool_input.get("file_path", "")
 
     # Check if this is dev-diary.txt
     if "dev-diary.txt" in file_path:
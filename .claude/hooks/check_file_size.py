@@ -1,65 +1,94 @@
 #!/usr/bin/env python3
 """Check if Python files exceed the recommended line count (excluding docstrings and comments)."""
 
-import ast
-import json
+from __future__ import annotations
+
 import sys
 from pathlib import Path
 
-
-def _get_docstring_lines(tree: ast.AST) -> set[int]:
-    """Extract line numbers of all docstrings in the AST."""
-    docstring_lines: set[int] = set()
-    for node in ast.walk(tree):
-        # Check for docstrings (string literals as first statement)
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)):
-            docstring = ast.get_docstring(node, clean=False)
+from hook_input import read_tool_input
+
+# Importing typing costs about as much as ast itself, so define the flag locally
+# (type checkers treat any TYPE_CHECKING name as true)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import ast
+
+# Logic line counts above these limits trigger an INFO note or a warning
+INFO_LINE_LIMIT = 300
+WARNING_LINE_LIMIT = 400
+
+
+def _get_docstring_intervals(tree: ast.AST) -> list[tuple[int, int]]:
+    """Extract the (start, end) line ranges of all docstrings in the AST, sorted by start line."""
+    import ast  # noqa: PLC0415 - deferred, see count_logic_lines
+
+    intervals: list[tuple[int, int]] = []
+    # Docstrings belong to modules, classes and functions, which can only appear as
+    # statements (possibly nested in if/try/with bodies or except handlers), never
+    # inside an expression. Skipping expression subtrees avoids most of the AST.
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        pending.extend(child for child in ast.iter_child_nodes(node) if not isinstance(child, ast.expr))
+        # Check for docstrings (non-empty string literals as first statement)
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module)) and node.body:
+            first_stmt = node.body[0]
             if (
-                docstring
-                and node.body
-                and isinstance(node.body[0], ast.Expr)
-                and isinstance(node.body[0].value, ast.Constant)
-                and node.body[0].end_lineno is not None
+                isinstance(first_stmt, ast.Expr)
+                and isinstance(first_stmt.value, ast.Constant)
+                and isinstance(first_stmt.value.value, str)
+                and first_stmt.value.value
+                and first_stmt.end_lineno is not None
             ):
-                first_stmt = node.body[0]
-                # Add all lines that the docstring spans
-                end_line = first_stmt.end_lineno
-                if end_line is not None:
-                    for line_no in range(first_stmt.lineno, end_line + 1):
-                        docstring_lines.add(line_no)
-    return docstring_lines
+                intervals.append((first_stmt.lineno, first_stmt.end_lineno))
+    # Docstrings never overlap, so sorting by start line also sorts by end line
+    intervals.sort()
+    return intervals
+
 
+def _count_code_lines(lines: list[str]) -> int:
+    """Count lines that are neither empty nor pure comments."""
+    return sum(1 for line in lines if (stripped := line.strip()) and not stripped.startswith("#"))
 
-def _count_logic_lines_from_source(source: str, docstring_lines: set[int]) -> int:
+
+def _count_logic_lines_from_source(source: str, docstring_intervals: list[tuple[int, int]]) -> int:
     """Count logic lines from source code, excluding docstrings and comments."""
+    # Count all code lines in one pass, then subtract the ones inside docstrings,
+    # instead of checking docstring membership for every line
     lines = source.splitlines()
-    logic_lines = 0
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
-        # Skip empty lines, pure comments, and docstring lines
-        if stripped and not stripped.startswith("#") and i not in docstring_lines:
-            logic_lines += 1
+    logic_lines = _count_code_lines(lines)
+    for start, end in docstring_intervals:
+        logic_lines -= _count_code_lines(lines[start - 1 : end])
     return logic_lines
 
 
-def _fallback_line_count(filepath: str) -> int:
+def _fallback_line_count(filepath: Path) -> int:
     """Fallback line count when AST parsing fails."""
     try:
-        with Path(filepath).open(encoding="utf-8") as f:
-            return len([line for line in f if line.strip() and not line.strip().startswith("#")])
+        # Read and split exactly as count_logic_lines() does, so this raw count is
+        # the logic count before docstrings are subtracted. Undecodable bytes are
+        # replaced rather than failing the count.
+        with filepath.open(encoding="utf-8", errors="replace") as f:
+            source = f.read()
     except OSError:
         return 0
+    return _count_code_lines(source.splitlines())
 
 
-def count_logic_lines(filepath: str) -> int:
+def count_logic_lines(filepath: Path) -> int:
     """Count non-docstring, non-comment lines in a Python file."""
+    # ast is imported here rather than at module level: its import is the most expensive
+    # part of startup, and most invocations exit on the raw line count without parsing
+    import ast  # noqa: PLC0415
+
     try:
-        with Path(filepath).open(encoding="utf-8") as f:
+        with filepath.open(encoding="utf-8") as f:
             source = f.read()
 
         tree = ast.parse(source)
-        docstring_lines = _get_docstring_lines(tree)
-        return _count_logic_lines_from_source(source, docstring_lines)
+        docstring_intervals = _get_docstring_intervals(tree)
+        return _count_logic_lines_from_source(source, docstring_intervals)
 
     except (SyntaxError, ValueError, OSError):
         # If we can't parse, fall back to simple line count
@@ -69,43 +98,46 @@ def count_logic_lines(filepath: str) -> int:
 def main() -> None:
     """Check file size and print warnings."""
     # Read hook data from stdin
-    try:
-        hook_data = json.load(sys.stdin)
-        tool_input = hook_data.get("tool_input", {})
-        file_path = tool_input.get("file_path", "")
-    except (json.JSONDecodeError, KeyError):
-        sys.exit(0)
+    tool_input = read_tool_input()
+    file_path = tool_input.get("file_path", "")
 
     # Skip demo files (they're excluded from linting)
     if "demo_files/" in file_path:
         sys.exit(0)
 
+    path = Path(file_path)
+
     # Skip test files
-    if Path(file_path).name.startswith("test_"):
+    if path.name.startswith("test_"):
+        sys.exit(0)
+
+    # Check the file size. The logic count is the raw count minus docstring lines, so
+    # files already under the limit by raw count never need the (much more expensive)
+    # AST parse. Missing or unreadable files count as 0 lines, so no separate exists()
+    # check.
+    if _fallback_line_count(path) <= INFO_LINE_LIMIT:
         sys.exit(0)
 
-    # Check the file size
-    if Path(file_path).exists():
-        logic_lines = count_logic_lines(file_path)
-
-        if logic_lines > 400:
-            message = (
-                f"⚠️ File {Path(file_path).name} has {logic_lines} logic lines "
-                "(excluding docstrings/comments). Consider splitting into smaller, "
-                "focused modules (recommended: 300-400 lines max). "
-                "Non-test Python files should be kept focused - split them into "
-                "smaller modules if they exceed ~400 lines of non-documentation code."
-            )
-            sys.stderr.write(message + "\n")
-            sys.exit(1)
-        elif logic_lines > 300:
-            message = (
-                f"INFO: File {Path(file_path).name} has {logic_lines} logic lines. "
-                "Approaching recommended limit of 300-400 lines. Consider refactoring "
-                "if the file continues to grow."
-            )
-            sys.stderr.write(message + "\n")
-            sys.exit(1)
+    logic_lines = count_logic_lines(path)
+
+    if logic_lines > WARNING_LINE_LIMIT:
+        message = (
+            f"⚠️ File {path.name} has {logic_lines} logic lines "
+            "(excluding docstrings/comments). Consider splitting into smaller, "
+            "focused modules (recommended: 300-400 lines max). "
+            "Non-test Python files should be kept focused - split them into "
+            "smaller modules if they exceed ~400 lines of non-documentation code."
+        )
+        sys.stderr.write(message + "\n")
+        sys.exit(1)
+    elif logic_lines > INFO_LINE_LIMIT:
+        message = (
+            f"INFO: File {path.name} has {logic_lines} logic lines. "
+            "Approaching recommended limit of 300-400 lines. Consider refactoring "
+            "if the file continues to grow."
+        )
+        sys.stderr.write(message + "\n")
+        sys.exit(1)
 
     sys.exit(0)
 
@@ -1,38 +1,48 @@
 #!/usr/bin/env python3
 """Check for relative imports in Python files and block if found."""
 
-import ast
-import json
+import re
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
+from hook_input import read_tool_input
+
+# Every relative import contains "from", optionally followed by whitespace (or a line
+# continuation), and then a dot ("from.foo import x" is valid). Snippets without this
+# can be accepted without building an AST.
+_RELATIVE_IMPORT_CANDIDATE = re.compile(r"\bfrom[\s\\]*\.")
 
-def has_relative_imports(source_code: str) -> list[dict[str, str | int]]:
-    """Check if source code contains relative imports."""
-    try:
-        tree = ast.parse(source_code)
-        relative_imports: list[dict[str, str | int]] = []
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom) and node.level > 0:
-                # level > 0 means relative import (e.g., from . import x, from .. import y)
-                import_str = "." * node.level
-                if node.module:
-                    import_str += node.module
-                relative_imports.append({"line": node.lineno, "import": f"from {import_str} import ..."})
+def has_relative_imports(source_code: str) -> Iterator[tuple[int, str]]:
+    """Yield the (line number, dotted module) of each relative import in source code."""
+    # Cheap pre-screens (substring, then regex); the AST confirms real imports and
+    # ignores matches in strings/comments
+    if "from" not in source_code or not _RELATIVE_IMPORT_CANDIDATE.search(source_code):
+        return
 
+    # ast is imported here rather than at module level: its import is the most expensive
+    # part of startup, and the pre-screens above clear almost every snippet
+    import ast  # noqa: PLC0415
+
+    try:
+        tree = ast.parse(source_code)
     except SyntaxError:
         # If we can't parse, don't block
-        return []
-    else:
-        return relative_imports
+        return
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.level > 0:
+            # level > 0 means relative import (e.g., from . import x, from .. import y)
+            yield node.lineno, "." * node.level + (node.module or "")
 
 
 def check_file_content(content: str, filepath: str) -> str | None:
     """Check if the file content (old_string or new_string) contains relative imports."""
-    relative_imports = has_relative_imports(content)
-    if relative_imports:
-        imports_desc = ", ".join([f"line {imp['line']}: {imp['import']}" for imp in relative_imports])
+    imports_desc = ", ".join(
+        f"line {lineno}: from {module} import ..." for lineno, module in has_relative_imports(content)
+    )
+    if imports_desc:
         return f"Found relative imports in {filepath}: {imports_desc}"
     return None
 
@@ -40,12 +50,8 @@ def check_file_content(content: str, filepath: str) -> str | None:
 def main() -> None:
     """Check for relative imports in file operations."""
     # Read hook data from stdin
-    try:
-        hook_data = json.load(sys.stdin)
-        tool_input = hook_data.get("tool_input", {})
-        file_path = tool_input.get("file_path", "")
-    except (json.JSONDecodeError, KeyError):
-        sys.exit(0)
+    tool_input = read_tool_input()
+    file_path = tool_input.get("file_path", "")
 
     # Skip demo files
     if "demo_files/" in file_path:
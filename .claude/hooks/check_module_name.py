@@ -1,34 +1,30 @@
 #!/usr/bin/env python3
 """Check for generic module names that should be avoided."""
 
-import json
-import re
 import sys
 from pathlib import Path
 
-GENERIC_PATTERNS = [
-    r".*_utils\.py$",
-    r".*_helpers\.py$",
-    r".*_misc\.py$",
-    r".*_common\.py$",
-    r".*_general\.py$",
-]
+from hook_input import read_tool_input
+
+GENERIC_SUFFIXES = (
+    "_utils.py",
+    "_helpers.py",
+    "_misc.py",
+    "_common.py",
+    "_general.py",
+)
 
 
 def is_generic_name(filename: str) -> bool:
-    """Check if filename matches generic patterns."""
-    return any(re.match(pattern, filename) for pattern in GENERIC_PATTERNS)
+    """Check if filename ends with a generic suffix."""
+    return filename.endswith(GENERIC_SUFFIXES)
 
 
 def main() -> None:
     """Check for generic module names in new file operations."""
     # Read hook data from stdin
-    try:
-        hook_data = json.load(sys.stdin)
-        tool_input = hook_data.get("tool_input", {})
-        file_path = tool_input.get("file_path", "")
-    except (json.JSONDecodeError, KeyError):
-        sys.exit(0)
+    tool_input = read_tool_input()
+    file_path = tool_input.get("file_path", "")
 
     # Skip demo files and test files
     if "demo_files/" in file_path or "/tests/" in file_path:
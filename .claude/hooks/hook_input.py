@@ -0,0 +1,36 @@
+"""Read the tool input that Claude Code passes to hooks on stdin."""
+
+from __future__ import annotations
+
+import json
+import sys
+
+# Importing typing would cost hooks a few milliseconds of startup for one annotation,
+# so define the flag locally (type checkers treat any TYPE_CHECKING name as true)
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def read_tool_input() -> dict[str, Any]:
+    """Read hook data from stdin and return its tool_input mapping.
+
+    Reads stdin as raw bytes in a single call and decodes it with json.loads,
+    skipping the text-layer decoding and buffered reads of json.load(sys.stdin).
+
+    Returns:
+        The tool_input mapping, or an empty dict if the hook data has none
+
+    Exits with status 0 (never blocking the tool call) if stdin is not valid JSON.
+    """
+    try:
+        hook_data = json.loads(sys.stdin.buffer.read())
+    except ValueError:
+        # Invalid JSON (JSONDecodeError and UnicodeDecodeError are ValueErrors) - don't block
+        sys.exit(0)
+
+    if not isinstance(hook_data, dict):
+        sys.exit(0)
+
+    tool_input = hook_data.get("tool_input", {})
+    return tool_input if isinstance(tool_input, dict) else {}
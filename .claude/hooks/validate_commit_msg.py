@@ -3,10 +3,11 @@
 
 from __future__ import annotations
 
-import json
 import re
 import sys
 
+from hook_input import read_tool_input
+
 VALID_TYPES = {
     "feat": "New user-facing functionality only (core app features)",
     "fix": "Bug fixes",
@@ -16,6 +17,29 @@ VALID_TYPES = {
     "chore": "Tooling, dependencies, build config, CI/CD",
 }
 
+# Heredoc format: -m "$(cat <<DELIMITER...DELIMITER)"
+# where DELIMITER is commonly 'EOF' but can be any string
+_HEREDOC_PATTERN = re.compile(r'-m\s*"\$\(cat\s*<<[\'"]?(\w+)[\'"]?\n(.*?)\n\1', re.DOTALL)
+
+# Simple quoted format: -m "message" or -m 'message'
+# Captures the message between matching quotes (group 1 for double, group 2 for single).
+# Explicit alternatives avoid a backreference and the lazy quantifier's backtracking.
+_SIMPLE_PATTERN = re.compile(r"""-m\s*(?:"([^"]*)"|'([^']*)')""")
+
+# Conventional commit format: ^(type1|type2|...)(\([^)]+\))?:\s+.+
+# Matched against the lowercased message, which is cheaper than re.IGNORECASE
+_COMMIT_PATTERN = re.compile(rf"^({'|'.join(VALID_TYPES)})(\([^)]+\))?:\s+.+")
+
+_VALID_TYPES_LIST = ", ".join(VALID_TYPES)
+_VALID_TYPES_DESCRIPTION = "\n".join([f"  - {t}: {desc}" for t, desc in VALID_TYPES.items()])
+
+# Constant tail of the validation error message, appended after the specific error
+_VALIDATION_ERROR_SUFFIX = (
+    f"\n\nValid types:\n{_VALID_TYPES_DESCRIPTION}\n\n"
+    "Format: <type>: <description>\n"
+    "Example: feat: add dark mode toggle\n"
+)
+
 
 def extract_commit_message(command: str) -> str | None:
     r"""Extract commit message from a git commit command.
@@ -36,26 +60,28 @@ def extract_commit_message(command: str) -> str | None:
         The extracted commit message (first line only for multi-line messages),
         or None if no message could be extracted
     """
-    # First check for heredoc format (must check before simple quotes)
-    # This pattern matches: -m "$(cat <<DELIMITER...DELIMITER)"
-    # where DELIMITER is commonly 'EOF' but can be any string
-    heredoc_pattern = r'-m\s*"\$\(cat\s*<<[\'"]?(\w+)[\'"]?\n(.*?)\n\1'
-    heredoc_match = re.search(heredoc_pattern, command, re.DOTALL)
-
-    if heredoc_match:
-        # Extract the full message content (group 2)
-        full_message = heredoc_match.group(2).strip()
-        # For validation, only use the first line (conventional commit format)
-        lines = full_message.split("\n")
-        return lines[0] if lines else None
+    # Both supported formats pass the message with -m; skip regex work otherwise
+    if "-m" not in command:
+        return None
+
+    # First check for heredoc format (must check before simple quotes). The DOTALL
+    # pattern is the most expensive one, so only run it when a heredoc is present.
+    if "<<" in command:
+        heredoc_match = _HEREDOC_PATTERN.search(command)
+
+        if heredoc_match:
+            # Extract the full message content (group 2)
+            full_message = heredoc_match.group(2).strip()
+            # For validation, only use the first line (conventional commit format)
+            lines = full_message.split("\n")
+            return lines[0] if lines else None
 
     # Handle simple quoted formats: -m "message" or -m 'message'
-    # This pattern captures the message between matching quotes
-    simple_pattern = r'-m\s*(["\'])([^\1]*?)\1'
-    simple_match = re.search(simple_pattern, command)
+    simple_match = _SIMPLE_PATTERN.search(command)
 
     if simple_match:
-        return simple_match.group(2)
+        double_quoted = simple_match.group(1)
+        return double_quoted if double_quoted is not None else simple_match.group(2)
 
     return None
 
@@ -76,19 +102,15 @@ def validate_commit_message(message: str) -> tuple[bool, str | None]:
         - is_valid: True if message follows format
         - error_message: Description of validation failure, or None if valid
     """
-    # Build regex pattern from valid types
-    # Pattern: ^(type1|type2|...)(\([^)]+\))?:\s+.+
-    types_pattern = "|".join(VALID_TYPES.keys())
-    full_pattern = rf"^({types_pattern})(\([^)]+\))?:\s+.+"
-
     # Check if message matches the pattern (case-insensitive)
-    if not re.match(full_pattern, message, re.IGNORECASE):
-        return False, f"Message must start with one of: {', '.join(VALID_TYPES.keys())}"
+    lowered = message.lower()
+    if not _COMMIT_PATTERN.match(lowered):
+        return False, f"Message must start with one of: {_VALID_TYPES_LIST}"
 
     # Extract and validate the commit type
     # Split on ':' to get type part, then split on '(' to remove scope if present
-    type_part = message.split(":")[0]
-    commit_type = type_part.split("(")[0].lower()
+    type_part = lowered.split(":")[0]
+    commit_type = type_part.split("(")[0]
 
     if commit_type not in VALID_TYPES:
         return False, f"Invalid commit type: {commit_type}"
@@ -105,13 +127,7 @@ def format_validation_error(error: str) -> str:
     Returns:
         A formatted error message with helpful context
     """
-    types_desc = "\n".join([f"  - {t}: {desc}" for t, desc in VALID_TYPES.items()])
-    return (
-        f"BLOCKED: Invalid commit message format. {error}\n\n"
-        f"Valid types:\n{types_desc}\n\n"
-        "Format: <type>: <description>\n"
-        "Example: feat: add dark mode toggle\n"
-    )
+    return f"BLOCKED: Invalid commit message format. {error}{_VALIDATION_ERROR_SUFFIX}"
 
 
 def main() -> None:
@@ -121,13 +137,8 @@ def main() -> None:
     It receives JSON data via stdin containing tool information.
     """
     # Read hook data from stdin
-    try:
-        hook_data = json.load(sys.stdin)
-        tool_input = hook_data.get("tool_input", {})
-        command = tool_input.get("command", "")
-    except (json.JSONDecodeError, KeyError):
-        # Invalid JSON or missing fields - don't block
-        sys.exit(0)
+    tool_input = read_tool_input()
+    command = tool_input.get("command", "")
 
     # Try to extract the commit message
     message = extract_commit_message(command)
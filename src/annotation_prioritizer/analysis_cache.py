@@ -0,0 +1,87 @@
+"""On-disk cache of per-file analysis results.
+
+Analyzing a file means parsing it and walking its AST several times, which takes
+milliseconds to seconds for large modules. When the same unchanged files are analyzed
+repeatedly (repeated CLI runs, editor integrations), that work can be replaced by a
+stat call and an unpickle.
+
+Cache entries are keyed by the file's path (both as given and absolute), modification
+time, and size, plus CACHE_VERSION. Results record file paths as given by the caller,
+so the same file reached through a different path has its own entry. Any edit to the
+file changes its mtime or size and therefore misses the cache; stale entries are simply
+never read again.
+
+The cache is best-effort: unreadable or corrupt entries are treated as misses, and
+failures to write an entry are ignored. Entries are pickles, so the cache directory
+must only be writable by trusted users.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+
+from annotation_prioritizer.models import AnalysisResult
+
+# Bump whenever a code change alters analysis results or the AnalysisResult layout,
+# so entries written by older versions are no longer used
+CACHE_VERSION = 4
+
+
+def make_cache_key(file_path: Path, file_stat: os.stat_result) -> str:
+    """Build the cache key for a file in its current state.
+
+    Args:
+        file_path: Path to the analyzed Python file
+        file_stat: Result of stat() on the file
+
+    Returns:
+        Hex digest identifying the file's path, mtime, size, and the cache version
+    """
+    # The path as given is part of the key because cached results store it in
+    # FunctionInfo.file_path; the absolute path keeps a relative path from matching
+    # a different file after a change of working directory
+    identity = (
+        f"{file_path}:{file_path.absolute()}:{file_stat.st_mtime_ns}:{file_stat.st_size}:{CACHE_VERSION}"
+    )
+    return hashlib.blake2b(identity.encode(), digest_size=20).hexdigest()
+
+
+def load_cached_result(cache_dir: Path, key: str) -> AnalysisResult | None:
+    """Load a cached analysis result.
+
+    Args:
+        cache_dir: Directory holding cache entries
+        key: Cache key from make_cache_key()
+
+    Returns:
+        The cached AnalysisResult, or None if there is no usable entry for the key
+    """
+    try:
+        result = pickle.loads((cache_dir / key).read_bytes())  # noqa: S301
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+        # Missing, truncated, corrupt, or written for an incompatible model layout
+        return None
+
+    return result if isinstance(result, AnalysisResult) else None
+
+
+def store_cached_result(cache_dir: Path, key: str, result: AnalysisResult) -> None:
+    """Store an analysis result in the cache, ignoring write failures.
+
+    The entry is written to a temporary file and renamed into place, so concurrent
+    readers never see a partially written entry.
+
+    Args:
+        cache_dir: Directory holding cache entries (created if missing)
+        key: Cache key from make_cache_key()
+        result: Analysis result to store
+    """
+    entry_path = cache_dir / key
+    temp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        temp_path.replace(entry_path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
@@ -1,39 +1,54 @@
-"""Main analysis orchestrator for type annotation prioritization."""
+"""Main analysis orchestrator for type annotation prioritization.
+
+Performance guidance:
+    Analysis time is spent in Python-level AST traversal: visitor dispatch over
+    heterogeneous ast node objects, scope bookkeeping, and name resolution. Numba and
+    similar numeric JITs cannot compile code that walks CPython objects, and would
+    only add compile and import overhead, so they are not used here. Compiling
+    modules with mypyc or Cython is not used either: it would add a native build
+    to a pure-Python hatchling package, and CallCountVisitor must stay
+    subclassable from interpreted code (tests extend it with visit_* methods).
+
+    Optimize by doing less interpreter work instead:
+    - Fuse passes. NameBindingCollector gathers bindings, class names, function
+      definitions, and calls in one traversal; calls are counted afterwards from the
+      recorded list. Prefer extending it over adding another visitor.
+    - Lean on C-implemented stdlib tools (dict/set lookups, operator.attrgetter, heapq,
+      str methods) rather than per-item Python frames.
+    - Parallelize across files (analyze_files), since each file is independent.
+"""
 
 import ast
+import heapq
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 
-from annotation_prioritizer.ast_visitors.call_counter import count_function_calls
-from annotation_prioritizer.ast_visitors.function_parser import parse_function_definitions
+from annotation_prioritizer.analysis_cache import load_cached_result, make_cache_key, store_cached_result
+from annotation_prioritizer.ast_visitors.call_counter import count_collected_calls
+from annotation_prioritizer.ast_visitors.function_parser import build_function_definitions
 from annotation_prioritizer.ast_visitors.name_binding_collector import NameBindingCollector
 from annotation_prioritizer.ast_visitors.parse_ast import parse_ast_from_file
-from annotation_prioritizer.models import (
-    AnalysisResult,
-    AnnotationScore,
-    FunctionPriority,
-    NameBindingKind,
-    QualifiedName,
-)
+from annotation_prioritizer.ast_visitors.postponed_annotations import uses_postponed_annotations
+from annotation_prioritizer.models import AnalysisResult, FunctionPriority
 from annotation_prioritizer.position_index import build_position_index
-from annotation_prioritizer.scoring import calculate_annotation_score
+from annotation_prioritizer.scoring import calculate_annotation_scores
 
 
-def calculate_priority_score(annotation_score: AnnotationScore, call_count: int) -> float:
-    """Combine annotation completeness and call frequency into priority score.
-
-    Higher priority = more calls + less annotated.
-    Priority = call_count * (1.0 - annotation_score.total_score)
-    """
-    return call_count * (1.0 - annotation_score.total_score)
-
-
-def analyze_ast(tree: ast.Module, source_code: str, filename: str = "test.py") -> AnalysisResult:
+def analyze_ast(
+    tree: ast.Module, source_code: str, filename: str = "test.py", top_k: int | None = None
+) -> AnalysisResult:
     """Complete analysis pipeline for a parsed AST.
 
     Args:
         tree: Parsed AST module
         source_code: Python source code as a string
         filename: Filename to use for the analysis (affects qualified names)
+        top_k: If given, only the top_k highest-priority functions are returned,
+            selected with a heap instead of sorting every function
 
     Returns:
         AnalysisResult with function priorities sorted by priority score
@@ -41,65 +56,141 @@ def analyze_ast(tree: ast.Module, source_code: str, filename: str = "test.py") -
     """
     file_path_obj = Path(filename)
 
-    # 1. Collect all name bindings in a single pass
-    collector = NameBindingCollector()
+    # 1. Collect all name bindings, function definitions, and calls in a single pass
+    collector = NameBindingCollector(postponed_annotations=uses_postponed_annotations(tree))
     collector.visit(tree)
 
     # 2. Build position-aware index with resolved variable targets
     position_index = build_position_index(collector.bindings, collector.unresolved_variables)
 
     # 3. Extract known classes for __init__ resolution
-    known_classes = {
-        binding.qualified_name
-        for binding in collector.bindings
-        if binding.kind == NameBindingKind.CLASS and binding.qualified_name
-    }
+    known_classes = collector.class_qualified_names
 
-    # 4. Parse function definitions (kept separate for detailed parameter info)
-    function_infos = parse_function_definitions(tree, file_path_obj, position_index)
+    # 4. Extract function metadata from the definitions found in step 1
+    function_infos = build_function_definitions(
+        collector.function_definitions, file_path_obj, position_index, known_classes
+    )
 
     if not function_infos:
         return AnalysisResult(priorities=(), unresolvable_calls=())
 
-    # 5. Count function calls
-    resolved_counts, unresolvable_calls = count_function_calls(
-        tree, function_infos, position_index, known_classes, source_code
+    # 5. Count function calls among the calls collected in step 1
+    call_count_map, unresolvable_calls = count_collected_calls(
+        collector.calls, function_infos, position_index, known_classes, source_code
     )
-    call_count_map: dict[QualifiedName, int] = {
-        cc.function_qualified_name: cc.call_count for cc in resolved_counts
-    }
 
-    # 6. Calculate annotation scores and combine into priority rankings
+    # 6. Calculate annotation scores and combine into priority rankings.
+    # Higher priority = more calls + less annotated (call count times the
+    # unannotated fraction)
     priorities: list[FunctionPriority] = []
-    for func_info in function_infos:
-        annotation_score = calculate_annotation_score(func_info)
+    annotation_scores = calculate_annotation_scores(function_infos)
+    for func_info, annotation_score in zip(function_infos, annotation_scores, strict=True):
         call_count = call_count_map.get(func_info.qualified_name, 0)
-        priority_score = calculate_priority_score(annotation_score, call_count)
-
         priority = FunctionPriority(
             function_info=func_info,
             annotation_score=annotation_score,
             call_count=call_count,
-            priority_score=priority_score,
+            priority_score=call_count * (1.0 - annotation_score.total_score),
         )
         priorities.append(priority)
 
-    # 7. Sort by priority score (highest first) and return complete result
-    sorted_priorities = tuple(sorted(priorities, key=lambda p: p.priority_score, reverse=True))
-    return AnalysisResult(priorities=sorted_priorities, unresolvable_calls=unresolvable_calls)
+    # 7. Sort by priority score (highest first) and return complete result.
+    # nlargest keeps the same order as a stable descending sort, ties included.
+    priority_key = attrgetter("priority_score")
+    if top_k is not None:
+        top_priorities = tuple(heapq.nlargest(top_k, priorities, key=priority_key))
+        return AnalysisResult(priorities=top_priorities, unresolvable_calls=unresolvable_calls)
+
+    priorities.sort(key=priority_key, reverse=True)
+    return AnalysisResult(priorities=tuple(priorities), unresolvable_calls=unresolvable_calls)
 
 
-def analyze_file(file_path: str) -> AnalysisResult:
+def analyze_file(file_path: str, cache_dir: Path | None = None) -> AnalysisResult:
     """Complete analysis pipeline for a single Python file.
 
-    Returns AnalysisResult with function priorities sorted by priority score
-    (highest first) and all unresolvable calls.
+    Args:
+        file_path: Path to the Python file to analyze
+        cache_dir: Optional directory for caching results across runs. When given,
+            an unchanged file (same path, mtime, and size) is loaded from the cache
+            instead of being re-analyzed.
+
+    Returns:
+        AnalysisResult with function priorities sorted by priority score
+        (highest first) and all unresolvable calls.
     """
     file_path_obj = Path(file_path)
 
-    parse_result = parse_ast_from_file(file_path_obj)
+    if cache_dir is None:
+        return _analyze_path(file_path_obj) or _empty_result()
+
+    try:
+        cache_key = make_cache_key(file_path_obj, file_path_obj.stat())
+    except OSError:
+        return _analyze_path(file_path_obj) or _empty_result()
+
+    cached = load_cached_result(cache_dir, cache_key)
+    if cached is not None:
+        return cached
+
+    result = _analyze_path(file_path_obj)
+    if result is None:
+        # Files that could not be read or parsed are not cached: fixing a permission
+        # problem changes neither the mtime nor the size, so the entry would outlive it
+        return _empty_result()
+
+    # Only store the result if the file was not modified while it was being analyzed
+    try:
+        unchanged = make_cache_key(file_path_obj, file_path_obj.stat()) == cache_key
+    except OSError:
+        unchanged = False
+    if unchanged:
+        store_cached_result(cache_dir, cache_key, result)
+    return result
+
+
+def analyze_files(
+    file_paths: Sequence[str], workers: int | None = None, cache_dir: Path | None = None
+) -> dict[str, AnalysisResult]:
+    """Analyze several Python files, in parallel across processes.
+
+    Each file is analyzed independently and the work is CPU-bound, so files are
+    distributed over a process pool (one interpreter per worker, sidestepping the
+    GIL). With a single file or a single worker, analysis runs in this process.
+
+    Args:
+        file_paths: Paths of the Python files to analyze
+        workers: Number of worker processes (default: number of usable CPUs)
+        cache_dir: Optional result cache directory, as for analyze_file()
+
+    Returns:
+        Mapping from each path in file_paths to its AnalysisResult
+    """
+    worker_count = workers or os.process_cpu_count() or 1
+    analyze = partial(analyze_file, cache_dir=cache_dir)
+
+    if worker_count == 1 or len(file_paths) <= 1:
+        return {file_path: analyze(file_path) for file_path in file_paths}
+
+    # Several files per task amortizes inter-process overhead, while ~4 tasks per
+    # worker keeps the load balanced when file sizes vary
+    chunksize = max(1, len(file_paths) // (worker_count * 4))
+    with ProcessPoolExecutor(max_workers=min(worker_count, len(file_paths))) as executor:
+        return dict(zip(file_paths, executor.map(analyze, file_paths, chunksize=chunksize), strict=True))
+
+
+def _empty_result() -> AnalysisResult:
+    """Return the result for a file that could not be read or parsed."""
+    return AnalysisResult(priorities=(), unresolvable_calls=())
+
+
+def _analyze_path(file_path: Path) -> AnalysisResult | None:
+    """Parse and analyze a single Python file without caching.
+
+    Returns None if the file could not be read or parsed.
+    """
+    parse_result = parse_ast_from_file(file_path)
     if not parse_result:
-        return AnalysisResult(priorities=(), unresolvable_calls=())
+        return None
 
     tree, source_code = parse_result
-    return analyze_ast(tree, source_code, str(file_path_obj))
+    return analyze_ast(tree, source_code, str(file_path))
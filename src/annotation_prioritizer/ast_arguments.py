@@ -1,17 +1,19 @@
 """Utilities for working with AST function arguments.
 
-This module provides focused utilities for iterating over and extracting
+This module provides focused utilities for collecting and extracting
 information from ast.arguments nodes, ensuring consistent handling of all
 Python parameter types across the codebase.
 """
 
 import ast
-from collections.abc import Iterator
-from enum import Enum, auto
+from enum import IntEnum, auto
 
 
-class ArgumentKind(Enum):
-    """Type of function argument."""
+class ArgumentKind(IntEnum):
+    """Type of function argument.
+
+    An IntEnum so that kind comparisons are plain integer equality checks.
+    """
 
     REGULAR = auto()  # Regular positional or keyword argument
     POSITIONAL_ONLY = auto()  # Positional-only argument (before /)
@@ -20,41 +22,41 @@ class ArgumentKind(Enum):
     VAR_KEYWORD = auto()  # **kwargs
 
 
-def iter_all_arguments(args: ast.arguments) -> Iterator[tuple[ast.arg, ArgumentKind]]:
-    """Iterate over all arguments in an ast.arguments node.
+def all_arguments(args: ast.arguments) -> tuple[tuple[ast.arg, ArgumentKind], ...]:
+    """Collect all arguments in an ast.arguments node.
 
     Processes all parameter types supported by Python: regular positional arguments,
     positional-only arguments (Python 3.8+), keyword-only arguments, *args, and
-    **kwargs. Yields all argument types in the order they would appear in a function
+    **kwargs. Returns all argument types in the order they would appear in a function
     signature, providing both the AST node and the kind of argument.
 
+    The result is built eagerly with list comprehensions rather than yielded from a
+    generator, since callers always consume every argument.
+
     Args:
         args: AST arguments node from a function definition
 
-    Yields:
-        Tuples of (ast.arg node, ArgumentKind) for each parameter
+    Returns:
+        Tuple of (ast.arg node, ArgumentKind) pairs, one for each parameter
 
     Example:
-        >>> for arg, kind in iter_all_arguments(func_node.args):
+        >>> for arg, kind in all_arguments(func_node.args):
         ...     if arg.annotation:
         ...         process_annotation(arg.arg, arg.annotation)
     """
-    # Positional-only arguments (Python 3.8+)
-    for arg in args.posonlyargs:
-        yield arg, ArgumentKind.POSITIONAL_ONLY
-
-    # Regular positional arguments
-    for arg in args.args:
-        yield arg, ArgumentKind.REGULAR
+    # Positional-only arguments (Python 3.8+), then regular positional arguments
+    arguments = [(arg, ArgumentKind.POSITIONAL_ONLY) for arg in args.posonlyargs]
+    arguments += [(arg, ArgumentKind.REGULAR) for arg in args.args]
 
     # *args parameter
     if args.vararg is not None:
-        yield args.vararg, ArgumentKind.VAR_POSITIONAL
+        arguments.append((args.vararg, ArgumentKind.VAR_POSITIONAL))
 
     # Keyword-only arguments
-    for arg in args.kwonlyargs:
-        yield arg, ArgumentKind.KEYWORD_ONLY
+    arguments += [(arg, ArgumentKind.KEYWORD_ONLY) for arg in args.kwonlyargs]
 
     # **kwargs parameter
     if args.kwarg is not None:
-        yield args.kwarg, ArgumentKind.VAR_KEYWORD
+        arguments.append((args.kwarg, ArgumentKind.VAR_KEYWORD))
+
+    return tuple(arguments)
@@ -28,24 +28,31 @@ Limitations:
 
 import ast
 import builtins
+import re
+import sys
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
 from typing import override
 
+from annotation_prioritizer.ast_visitors.name_binding_collector import NameBindingCollector
+from annotation_prioritizer.ast_visitors.postponed_annotations import uses_postponed_annotations
+from annotation_prioritizer.ast_visitors.traversal import ScopeTrackingVisitor
 from annotation_prioritizer.models import (
     CallCount,
     FunctionInfo,
     NameBinding,
     NameBindingKind,
     QualifiedName,
-    Scope,
-    ScopeKind,
+    ScopeStack,
     UnresolvableCall,
     make_qualified_name,
 )
-from annotation_prioritizer.position_index import PositionIndex, resolve_name
+from annotation_prioritizer.position_index import (
+    PositionIndex,
+    get_scope_chain,
+    resolve_name_in_scope_chain,
+)
 from annotation_prioritizer.scope_tracker import (
-    add_scope,
-    create_initial_stack,
-    drop_last_scope,
     get_containing_class_qualified_name,
     get_execution_context,
 )
@@ -53,6 +60,19 @@ from annotation_prioritizer.scope_tracker import (
 # Maximum length for unresolvable call text before truncation
 MAX_UNRESOLVABLE_CALL_LENGTH = 200
 
+# Split points after each line ending the tokenizer recognizes (\n, \r\n, or a lone \r).
+# str.splitlines() also splits on \f, \v, and other separators, which would shift lines.
+_LINE_SPLIT_PATTERN = re.compile(r"(?<=\n)|(?<=\r)(?!\n)")
+
+# The separators str.splitlines() recognizes besides \n and \r. Sources without any
+# of them, which is nearly all of them, can use the much faster str.splitlines().
+_EXTRA_LINE_SEPARATORS = ("\v", "\f", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+
+# Names of the callable attributes of the builtins module (print, len, ValueError, ...)
+_BUILTIN_CALLABLES: frozenset[str] = frozenset(
+    name for name in dir(builtins) if callable(getattr(builtins, name))
+)
+
 
 def _is_builtin_call(node: ast.Call) -> bool:
     """Check if a call is to a Python built-in function.
@@ -66,11 +86,8 @@ def _is_builtin_call(node: ast.Call) -> bool:
     Returns:
         True if this is a call to a built-in function, False otherwise
     """
-    if isinstance(node.func, ast.Name):
-        # Only consider callable attributes of builtins module
-        name = node.func.id
-        return hasattr(builtins, name) and callable(getattr(builtins, name))
-    return False
+    func = node.func
+    return type(func) is ast.Name and func.id in _BUILTIN_CALLABLES
 
 
 def _extract_attribute_chain(node: ast.Attribute) -> list[str] | None:
@@ -83,26 +100,77 @@ def _extract_attribute_chain(node: ast.Attribute) -> list[str] | None:
         List of attribute parts like ['Outer', 'Inner'], or None if the chain
         doesn't start with a simple name (e.g., starts with a function call)
     """
+    # Collected innermost-first, then reversed once
     parts = [node.attr]
     current = node.value
 
-    while isinstance(current, ast.Attribute):
-        parts.insert(0, current.attr)
+    while type(current) is ast.Attribute:
+        parts.append(current.attr)
         current = current.value
 
     # The leftmost part should be a Name
-    if not isinstance(current, ast.Name):
+    if type(current) is not ast.Name:
         return None
 
-    parts.insert(0, current.id)
+    parts.append(current.id)
+    parts.reverse()
     return parts
 
 
+def _split_source_lines(source_code: str) -> list[str]:
+    """Split source code into lines, keeping line endings, as the parser numbers them."""
+    if any(separator in source_code for separator in _EXTRA_LINE_SEPARATORS):
+        return _LINE_SPLIT_PATTERN.split(source_code)
+    return source_code.splitlines(keepends=True)
+
+
+def _source_segment(source_lines: list[str], node: ast.expr, max_length: int | None = None) -> str | None:
+    """Get the source text of an expression from pre-split source lines.
+
+    Same result as ast.get_source_segment(), which re-splits the entire source on
+    every call; splitting once per file makes extracting many segments cheap.
+
+    Args:
+        source_lines: Source code split with _split_source_lines()
+        node: Expression node with position information
+        max_length: If given, lines of a multi-line expression stop being joined once
+            the text is longer than this, so the result may be a prefix of the
+            expression's text (still longer than max_length) rather than all of it
+
+    Returns:
+        The exact source text of the node (or a prefix of it, see max_length), or
+        None if the node has no end position
+    """
+    if node.end_lineno is None or node.end_col_offset is None:
+        return None
+
+    # Column offsets are UTF-8 byte offsets
+    first_index = node.lineno - 1
+    last_index = node.end_lineno - 1
+    if first_index == last_index:
+        return source_lines[first_index].encode()[node.col_offset : node.end_col_offset].decode()
+
+    limit = sys.maxsize if max_length is None else max_length
+    pieces = [source_lines[first_index].encode()[node.col_offset :].decode()]
+    length = len(pieces[0])
+    for index in range(first_index + 1, last_index):
+        if length > limit:
+            return "".join(pieces)
+        line = source_lines[index]
+        pieces.append(line)
+        length += len(line)
+
+    if length > limit:
+        return "".join(pieces)
+    pieces.append(source_lines[last_index].encode()[: node.end_col_offset].decode())
+    return "".join(pieces)
+
+
 def count_function_calls(
     tree: ast.Module,
     known_functions: tuple[FunctionInfo, ...],
     position_index: PositionIndex,
-    known_classes: set[QualifiedName],
+    known_classes: AbstractSet[QualifiedName],
     source_code: str,
 ) -> tuple[tuple[CallCount, ...], tuple[UnresolvableCall, ...]]:
     """Count calls to known functions in the AST.
@@ -117,18 +185,74 @@ def count_function_calls(
     Returns:
         Tuple of (resolved call counts, unresolvable calls)
     """
-    visitor = CallCountVisitor(known_functions, position_index, known_classes, source_code)
-    visitor.visit(tree)
+    call_counts, unresolvable_calls = count_function_calls_by_name(
+        tree, known_functions, position_index, known_classes, source_code
+    )
 
     resolved = tuple(
-        CallCount(function_qualified_name=name, call_count=count)
-        for name, count in visitor.call_counts.items()
+        CallCount(function_qualified_name=name, call_count=count) for name, count in call_counts.items()
     )
 
-    return (resolved, visitor.get_unresolvable_calls())
+    return (resolved, unresolvable_calls)
+
+
+def count_collected_calls(
+    calls: Iterable[tuple[ast.Call, ScopeStack]],
+    known_functions: tuple[FunctionInfo, ...],
+    position_index: PositionIndex,
+    known_classes: AbstractSet[QualifiedName],
+    source_code: str,
+) -> tuple[dict[QualifiedName, int], tuple[UnresolvableCall, ...]]:
+    """Count calls to known functions among calls collected by NameBindingCollector.
+
+    Gives the same result as visiting the tree the calls were collected from with
+    CallCountVisitor, without traversing the tree again.
 
+    Args:
+        calls: (call, scope_stack) tuples in traversal order (NameBindingCollector.calls)
+        known_functions: Functions to count calls for
+        position_index: Position-aware index for name resolution
+        known_classes: Set of known class qualified names for __init__ resolution
+        source_code: Source code for error context
 
-class CallCountVisitor(ast.NodeVisitor):
+    Returns:
+        Tuple of (call count per known function qualified name, unresolvable calls)
+    """
+    visitor = CallCountVisitor(known_functions, position_index, known_classes, source_code)
+    visitor.count_calls(calls)
+    return (visitor.call_counts, visitor.get_unresolvable_calls())
+
+
+def count_function_calls_by_name(
+    tree: ast.Module,
+    known_functions: tuple[FunctionInfo, ...],
+    position_index: PositionIndex,
+    known_classes: AbstractSet[QualifiedName],
+    source_code: str,
+) -> tuple[dict[QualifiedName, int], tuple[UnresolvableCall, ...]]:
+    """Count calls to known functions in the AST, keyed by qualified name.
+
+    Same as count_function_calls(), but returns the visitor's counts directly
+    instead of materializing CallCount objects, for callers that only need
+    per-name lookups. Calls are gathered with NameBindingCollector and counted
+    with count_collected_calls(), the same path the analyzer takes.
+
+    Args:
+        tree: Parsed AST module
+        known_functions: Functions to count calls for
+        position_index: Position-aware index for name resolution
+        known_classes: Set of known class qualified names for __init__ resolution
+        source_code: Source code for error context
+
+    Returns:
+        Tuple of (call count per known function qualified name, unresolvable calls)
+    """
+    collector = NameBindingCollector(postponed_annotations=uses_postponed_annotations(tree))
+    collector.visit(tree)
+    return count_collected_calls(collector.calls, known_functions, position_index, known_classes, source_code)
+
+
+class CallCountVisitor(ScopeTrackingVisitor):
     """AST visitor that counts calls to known functions.
 
     Traverses the AST to identify and count function calls, maintaining context
@@ -156,14 +280,34 @@ class CallCountVisitor(ast.NodeVisitor):
     The visitor maintains scope state during traversal (_scope_stack) to track the
     current scope context, enabling proper resolution of self.method() calls
     to their qualified names (e.g., "__module__.Calculator.add").
+
+    Traversal:
+        Scopes and the dispatch-table traversal come from ScopeTrackingVisitor.
+        Subclasses can still add visit_* methods as with ast.NodeVisitor.
     """
 
+    # Slots make the attribute reads during resolution fixed-offset lookups
+    __slots__ = (
+        "_containing_class",
+        "_execution_context",
+        "_known_classes",
+        "_member_names",
+        "_position_index",
+        "_resolve_cache",
+        "_scope_chain",
+        "_source_lines",
+        "_unresolvable_calls",
+        "call_counts",
+    )
+
     def __init__(
         self,
         known_functions: tuple[FunctionInfo, ...],
         position_index: PositionIndex,
-        known_classes: set[QualifiedName],
+        known_classes: AbstractSet[QualifiedName],
         source_code: str,
+        *,
+        postponed_annotations: bool = False,
     ) -> None:
         """Initialize visitor with functions to track and position index.
 
@@ -172,83 +316,117 @@ class CallCountVisitor(ast.NodeVisitor):
             position_index: Position-aware index for name resolution
             known_classes: Set of known class qualified names for __init__ resolution
             source_code: Source code for extracting unresolvable call text
+            postponed_annotations: Whether the module uses 'from __future__ import
+                annotations' (see uses_postponed_annotations()). If so, annotations
+                are never evaluated and calls inside them are not counted.
         """
-        super().__init__()
+        super().__init__(postponed_annotations=postponed_annotations)
         # Create internal call count tracking from known functions
         self.call_counts: dict[QualifiedName, int] = {func.qualified_name: 0 for func in known_functions}
         self._position_index = position_index
-        self._known_classes = known_classes
-        self._scope_stack = create_initial_stack()
-        self._source_code = source_code
+        # A private frozen copy: the caller's set can't change under the visitor
+        self._known_classes = frozenset(known_classes)
+        self._source_lines = _split_source_lines(source_code)
         self._unresolvable_calls: list[UnresolvableCall] = []
+        # Name resolutions in the current scope, keyed by (name, line number)
+        self._resolve_cache: dict[tuple[str, int], NameBinding | None] = {}
+        # Qualified names built during resolution, keyed by (base name, member)
+        self._member_names: dict[tuple[QualifiedName, str], QualifiedName] = {}
+        # State derived from _scope_stack for name resolution, kept in sync by _set_scope_stack()
+        self._scope_chain = get_scope_chain(position_index, self._scope_stack)
+        self._execution_context = get_execution_context(self._scope_stack)
+        self._containing_class = get_containing_class_qualified_name(self._scope_stack)
 
-    def _resolve_name_at_position(self, name: str, lineno: int) -> NameBinding | None:
-        """Resolve a name at a specific position using the current scope context.
+    @override
+    def _set_scope_stack(self, scope_stack: ScopeStack) -> None:
+        """Make scope_stack the current scope, updating the state derived from it.
 
-        Args:
-            name: The name to resolve
-            lineno: Line number for position-aware resolution
+        Everything name resolution needs from the scope stack (the scope chain to
+        search, the execution context, and the innermost enclosing class for
+        self/cls calls) is computed once here instead of for every resolved name.
+        Cached resolutions belong to the previous scope and are dropped.
 
-        Returns:
-            NameBinding if the name can be resolved, None otherwise
+        Args:
+            scope_stack: The new current scope stack
         """
-        return resolve_name(
-            self._position_index,
-            name,
-            lineno,
-            self._scope_stack,
-            get_execution_context(self._scope_stack),
-        )
+        self._scope_stack = scope_stack
+        self._scope_chain = get_scope_chain(self._position_index, scope_stack)
+        self._execution_context = get_execution_context(scope_stack)
+        self._containing_class = get_containing_class_qualified_name(scope_stack)
+        self._resolve_cache.clear()
 
-    @override
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Visit a class definition, tracking it as a scope.
+    def _qualified_member(self, base: QualifiedName, member: str) -> QualifiedName:
+        """Build the qualified name of a member (method, nested class) of base.
 
-        Class bodies execute IMMEDIATELY when the class is defined, even if
-        the class definition is nested inside a function.
-        """
-        self._scope_stack = add_scope(self._scope_stack, Scope(kind=ScopeKind.CLASS, name=node.name))
-        self.generic_visit(node)
-        self._scope_stack = drop_last_scope(self._scope_stack)
+        The same few names are built over and over across call sites, so each
+        one is formatted once and then reused from a cache.
 
-    @override
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Visit a function definition, tracking it as a scope.
+        Args:
+            base: Qualified name of the containing class
+            member: Member name, possibly dotted (e.g. "Inner.method")
 
-        Function bodies execute DEFERRED - only when the function is called,
-        not when it's defined. This allows forward references.
+        Returns:
+            The qualified name "base.member"
         """
-        self._scope_stack = add_scope(self._scope_stack, Scope(kind=ScopeKind.FUNCTION, name=node.name))
-        self.generic_visit(node)
-        self._scope_stack = drop_last_scope(self._scope_stack)
+        key = (base, member)
+        qualified = self._member_names.get(key)
+        if qualified is None:
+            qualified = make_qualified_name(f"{base}.{member}")
+            self._member_names[key] = qualified
+        return qualified
 
-    @override
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Visit an async function definition, tracking it as a scope.
+    def _resolve_name_at_position(self, name: str, lineno: int) -> NameBinding | None:
+        """Resolve a name at a specific position using the current scope context.
 
-        Async function bodies also execute DEFERRED.
+        Results are cached per (name, line) until the scope changes, since a call
+        such as obj.method(obj.other()) or Outer.Inner.method() resolves the same
+        name at the same position more than once.
+
+        Args:
+            name: The name to resolve
+            lineno: Line number for position-aware resolution
+
+        Returns:
+            NameBinding if the name can be resolved, None otherwise
         """
-        self._scope_stack = add_scope(self._scope_stack, Scope(kind=ScopeKind.FUNCTION, name=node.name))
-        self.generic_visit(node)
-        self._scope_stack = drop_last_scope(self._scope_stack)
+        cache_key = (name, lineno)
+        if cache_key in self._resolve_cache:
+            return self._resolve_cache[cache_key]
+
+        binding = resolve_name_in_scope_chain(self._scope_chain, name, lineno, self._execution_context)
+        self._resolve_cache[cache_key] = binding
+        return binding
 
     @override
-    def visit_Call(self, node: ast.Call) -> None:
-        """Visit function call to count calls to known functions."""
+    def _record_call(self, node: ast.Call) -> None:
+        """Count a call to a known function, or track it if it can't be resolved."""
         call_name = self._resolve_call_name(node)
 
-        match call_name:
-            case name if name and name in self.call_counts:
-                # Resolved and in known_functions - increment count
-                self.call_counts[name] += 1
-            case None if not _is_builtin_call(node):
+        if call_name is None:
+            if not _is_builtin_call(node):
                 # Unresolvable and not a builtin - track for diagnostics
                 self._track_unresolvable_call(node)
-            case _:
-                # Resolved but not in known_functions, or builtin - ignore
-                pass
+        else:
+            # One lookup both tests membership and reads the current count;
+            # names resolved but not in known_functions are ignored
+            count = self.call_counts.get(call_name)
+            if count is not None:
+                self.call_counts[call_name] = count + 1
+
+    def count_calls(self, calls: Iterable[tuple[ast.Call, ScopeStack]]) -> None:
+        """Count calls collected elsewhere, each made in the scope it is paired with.
 
-        self.generic_visit(node)
+        Equivalent to visiting each call node in its scope, except that calls
+        nested inside a call's arguments are not found by descending into it;
+        they must be in calls themselves, as NameBindingCollector records them.
+
+        Args:
+            calls: (call, scope_stack) tuples in traversal order
+        """
+        for call, scope_stack in calls:
+            if scope_stack is not self._scope_stack:
+                self._set_scope_stack(scope_stack)
+            self._record_call(call)
 
     def get_unresolvable_calls(self) -> tuple[UnresolvableCall, ...]:
         """Get all unresolvable calls found during traversal."""
@@ -257,13 +435,14 @@ class CallCountVisitor(ast.NodeVisitor):
     def _track_unresolvable_call(self, node: ast.Call) -> None:
         """Track a call that cannot be resolved to a known function.
 
-        Uses ast.get_source_segment() to extract the exact call text, handling
-        multi-line calls and complex expressions correctly.
+        Extracts the exact call text from the source lines split once in __init__,
+        handling multi-line calls and complex expressions correctly.
 
         Args:
             node: The AST Call node that couldn't be resolved
         """
-        call_text = ast.get_source_segment(self._source_code, node)
+        # Long multi-line calls are only extracted as far as the truncated text needs
+        call_text = _source_segment(self._source_lines, node, MAX_UNRESOLVABLE_CALL_LENGTH)
         if not call_text:
             call_text = "<unable to extract call text>"
 
@@ -287,15 +466,16 @@ class CallCountVisitor(ast.NodeVisitor):
             Qualified function name if resolvable, None otherwise.
         """
         func = node.func
-
-        if isinstance(func, ast.Name):
+        # Exact type checks: ast node classes are never subclassed by the parser,
+        # and an identity comparison is cheaper than isinstance() for every call
+        if type(func) is ast.Name:
             return self._resolve_direct_call(func)
 
-        if isinstance(func, ast.Attribute):
+        if type(func) is ast.Attribute:
             resolved = self._resolve_method_call(func)
             if resolved and resolved in self._known_classes:
                 # It's actually a nested class instantiation like Outer.Inner()
-                return make_qualified_name(f"{resolved}.__init__")
+                return self._qualified_member(resolved, "__init__")
             return resolved
 
         # Dynamic calls: getattr(obj, 'method')(), obj[key](), etc.
@@ -316,40 +496,28 @@ class CallCountVisitor(ast.NodeVisitor):
         """
         binding = self._resolve_name_at_position(func.id, func.lineno)
 
-        if binding is None or binding.kind == NameBindingKind.IMPORT:
+        if binding is None or binding.kind is NameBindingKind.IMPORT:
             # Unresolvable or imported (Phase 1 limitation)
             return None
 
-        if binding.kind == NameBindingKind.CLASS:
+        if binding.kind is NameBindingKind.CLASS and binding.qualified_name:
             # Class instantiation - resolve to __init__
-            return make_qualified_name(f"{binding.qualified_name}.__init__")
+            return self._qualified_member(binding.qualified_name, "__init__")
 
-        if binding.kind == NameBindingKind.FUNCTION:
+        if binding.kind is NameBindingKind.FUNCTION:
             # Regular function call
             return binding.qualified_name
 
         # Variables aren't directly callable
         return None
 
-    def _resolve_self_or_cls_method_call(self, func: ast.Attribute) -> QualifiedName | None:
-        """Resolve self.method() or cls.method() calls to their qualified names.
-
-        Args:
-            func: The ast.Attribute node representing the method call
-
-        Returns:
-            Qualified method name if this is a self/cls method call, None otherwise
-        """
-        if not isinstance(func.value, ast.Name) or func.value.id not in ("self", "cls"):
-            return None
-
-        class_qualified = get_containing_class_qualified_name(self._scope_stack)
-        if class_qualified:
-            return make_qualified_name(f"{class_qualified}.{func.attr}")
-        return None
+    def _resolve_method_call(self, func: ast.Attribute) -> QualifiedName | None:
+        """Resolve qualified name from a method call using position-aware index.
 
-    def _resolve_single_name_method_call(self, func: ast.Attribute) -> QualifiedName | None:
-        """Resolve variable.method() or ClassName.method() calls.
+        Handles self.method(), cls.method(), ClassName.method(), variable.method(),
+        and compound class references like Outer.Inner.method() calls. Dispatches
+        on the type of the receiver expression once, so each call site only runs
+        the strategy that can apply to it.
 
         Args:
             func: The ast.Attribute node representing the method call
@@ -357,58 +525,44 @@ class CallCountVisitor(ast.NodeVisitor):
         Returns:
             Qualified method name if resolvable, None otherwise
         """
-        if not isinstance(func.value, ast.Name):
-            return None
-
-        binding = self._resolve_name_at_position(func.value.id, func.lineno)
+        receiver = func.value
 
-        if binding and binding.kind == NameBindingKind.VARIABLE and binding.target_class:
-            # We know what class the variable refers to
-            return make_qualified_name(f"{binding.target_class}.{func.attr}")
+        if type(receiver) is ast.Name:
+            if receiver.id in ("self", "cls") and self._containing_class:
+                return self._qualified_member(self._containing_class, func.attr)
+            # Other names, and self/cls outside a class, resolve through their bindings
+            return self._resolve_single_name_method_call(receiver, func.attr)
 
-        # Check if it's a class reference for ClassName.method() calls
-        if binding and binding.kind == NameBindingKind.CLASS:
-            return make_qualified_name(f"{binding.qualified_name}.{func.attr}")
+        if type(receiver) is ast.Attribute:
+            # Compound class reference like Outer.Inner.method()
+            resolved_class = self._resolve_compound_class_reference(receiver, func.lineno)
+            if resolved_class:
+                return self._qualified_member(resolved_class, func.attr)
 
+        # Method calls on other expressions (calls, subscripts, literals, ...)
         return None
 
-    def _resolve_compound_method_call(self, func: ast.Attribute) -> QualifiedName | None:
-        """Resolve compound method calls like Outer.Inner.method().
+    def _resolve_single_name_method_call(self, receiver: ast.Name, method_name: str) -> QualifiedName | None:
+        """Resolve variable.method() or ClassName.method() calls.
 
         Args:
-            func: The ast.Attribute node representing the method call
+            receiver: The ast.Name node the method is called on
+            method_name: Name of the called method
 
         Returns:
             Qualified method name if resolvable, None otherwise
         """
-        if not isinstance(func.value, ast.Attribute):
-            return None
-
-        # Try to resolve the compound class reference
-        resolved_class = self._resolve_compound_class_reference(func.value, func.lineno)
-        if resolved_class:
-            return make_qualified_name(f"{resolved_class}.{func.attr}")
+        binding = self._resolve_name_at_position(receiver.id, receiver.lineno)
 
-        return None
-
-    def _resolve_method_call(self, func: ast.Attribute) -> QualifiedName | None:
-        """Resolve qualified name from a method call using position-aware index.
-
-        Handles self.method(), cls.method(), ClassName.method(), variable.method(),
-        and compound class references like Outer.Inner.method() calls.
+        if binding and binding.kind is NameBindingKind.VARIABLE and binding.target_class:
+            # We know what class the variable refers to
+            return self._qualified_member(binding.target_class, method_name)
 
-        Args:
-            func: The ast.Attribute node representing the method call
+        # Check if it's a class reference for ClassName.method() calls
+        if binding and binding.kind is NameBindingKind.CLASS and binding.qualified_name:
+            return self._qualified_member(binding.qualified_name, method_name)
 
-        Returns:
-            Qualified method name if resolvable, None otherwise
-        """
-        # Try each resolution strategy in order
-        return (
-            self._resolve_self_or_cls_method_call(func)
-            or self._resolve_single_name_method_call(func)
-            or self._resolve_compound_method_call(func)
-        )
+        return None
 
     def _resolve_compound_class_reference(self, node: ast.Attribute, lineno: int) -> QualifiedName | None:
         """Resolve a compound class reference like Outer.Inner or obj.Inner.
@@ -434,15 +588,15 @@ class CallCountVisitor(ast.NodeVisitor):
             return None
 
         # Get base qualified name from either CLASS or VARIABLE with target_class
-        if binding.kind == NameBindingKind.CLASS:
+        if binding.kind is NameBindingKind.CLASS and binding.qualified_name:
             base_qualified = binding.qualified_name
-        elif binding.kind == NameBindingKind.VARIABLE and binding.target_class is not None:
+        elif binding.kind is NameBindingKind.VARIABLE and binding.target_class is not None:
             base_qualified = binding.target_class
         else:
             return None
 
         # Build the full qualified name by appending the rest of the parts
-        full_qualified = make_qualified_name(f"{base_qualified}.{'.'.join(parts[1:])}")
+        full_qualified = self._qualified_member(base_qualified, ".".join(parts[1:]))
 
         # Verify this class actually exists in known_classes
         if full_qualified in self._known_classes:
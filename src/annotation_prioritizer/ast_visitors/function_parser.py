@@ -16,14 +16,17 @@ Key Design Decisions:
       to distinguish them from other functions with the same name.
     - Conservative extraction: Only handles statically defined functions; dynamic
       function creation (via exec, type(), etc.) is intentionally not supported.
-    - Complete scope tracking: Maintains a stack of both class and function scopes
-      during AST traversal to build accurate qualified names for nested structures.
+    - Complete scope tracking: Qualified names are built by NameBindingCollector, which
+      tracks both class and function scopes during its traversal, so nested
+      structures get accurate names.
 
-The module's primary entry point is parse_function_definitions(), which returns
-FunctionInfo objects containing all extracted metadata.
+The module's entry point is build_function_definitions(), which builds FunctionInfo
+objects containing all extracted metadata from the function definitions
+NameBindingCollector gathered, without another traversal of the AST.
 
 Relationship to Other Modules:
     - models.py: Defines the FunctionInfo, ParameterInfo, Scope, and ScopeKind data structures
+    - name_binding_collector.py: Collects the function definitions to build from
     - call_counter.py: Uses function definitions to resolve and count calls
     - analyzer.py: Combines definitions and call counts to compute priorities
 
@@ -34,25 +37,28 @@ Limitations:
 """
 
 import ast
+from collections.abc import Set as AbstractSet
 from pathlib import Path
-from typing import override
 
-from annotation_prioritizer.ast_arguments import ArgumentKind, iter_all_arguments
+from annotation_prioritizer.ast_arguments import ArgumentKind, all_arguments
 from annotation_prioritizer.models import (
     FunctionInfo,
     NameBindingKind,
     ParameterInfo,
-    Scope,
-    ScopeKind,
+    QualifiedName,
     make_qualified_name,
 )
 from annotation_prioritizer.position_index import PositionIndex
-from annotation_prioritizer.scope_tracker import (
-    ScopeStack,
-    add_scope,
-    build_qualified_name,
-    create_initial_stack,
-    drop_last_scope,
+
+# Parameters of every synthetic __init__: just an unannotated 'self'. ParameterInfo is
+# immutable, so all synthetic methods share this one tuple.
+_SYNTHETIC_INIT_PARAMETERS = (
+    ParameterInfo(
+        name="self",
+        has_annotation=False,
+        is_variadic=False,
+        is_keyword=False,
+    ),
 )
 
 
@@ -68,174 +74,48 @@ def _extract_parameters(args: ast.arguments) -> tuple[ParameterInfo, ...]:
         order. Each ParameterInfo indicates the parameter's name, whether it has
         a type annotation, and special properties (variadic, keyword).
     """
-    parameters: list[ParameterInfo] = []
-
-    for arg, kind in iter_all_arguments(args):
-        parameters.append(
+    # A list comprehension measured marginally faster than tuple() over a generator
+    return tuple(
+        [
             ParameterInfo(
                 name=arg.arg,
                 has_annotation=arg.annotation is not None,
-                is_variadic=kind == ArgumentKind.VAR_POSITIONAL,
-                is_keyword=kind == ArgumentKind.VAR_KEYWORD,
+                is_variadic=kind is ArgumentKind.VAR_POSITIONAL,
+                is_keyword=kind is ArgumentKind.VAR_KEYWORD,
             )
-        )
-
-    return tuple(parameters)
-
-
-class FunctionDefinitionVisitor(ast.NodeVisitor):
-    """AST visitor that extracts function definitions and their metadata.
+            for arg, kind in all_arguments(args)
+        ]
+    )
 
-    This visitor implements the standard ast.NodeVisitor pattern to traverse Python
-    Abstract Syntax Trees and extract comprehensive information about all function
-    definitions. It handles regular functions, async functions, and methods within
-    classes, building qualified names that preserve the full context of where each
-    function is defined.
 
-    The visitor maintains state during traversal to track scope nesting (classes and
-    functions), which is essential for building qualified names like
-    "OuterClass.InnerClass.method" and "OuterClass.method.inner_func". This
-    scope-aware naming ensures that nested functions and methods are properly
-    distinguished during call counting and analysis.
+def _build_function_info(
+    node: ast.FunctionDef | ast.AsyncFunctionDef, qualified_name: QualifiedName, file_path: Path
+) -> FunctionInfo:
+    """Build the FunctionInfo for a function definition node.
 
-    Traversal Behavior:
-        Classes and functions are tracked for building qualified names. FunctionDef
-        and AsyncFunctionDef nodes trigger extraction of full function metadata. The
-        visitor continues traversing into nested structures to find all functions,
-        including nested functions and methods in nested classes.
-
-    Usage:
-        After calling visit() on an AST tree, access the 'functions' attribute to
-        retrieve the collected FunctionInfo objects:
-
-        >>> visitor = FunctionDefinitionVisitor(file_path)
-        >>> visitor.visit(tree)
-        >>> extracted_functions = visitor.functions
+    Args:
+        node: AST node for either a regular or async function definition.
+        qualified_name: Fully qualified name of the function.
+        file_path: Path to the source file, stored for traceability.
 
-    Design Notes:
-        - Uses generic_visit() to ensure complete traversal of nested structures
-        - Treats async functions identically to regular functions for metadata extraction
-        - Does not attempt to resolve inherited methods or overrides
-        - Preserves all parameter types (positional, keyword-only, *args, **kwargs)
-        - Tracks both class and function scopes for accurate qualified naming
+    Returns:
+        FunctionInfo with the function's parameters and return annotation status.
     """
-
-    def __init__(self, file_path: Path) -> None:
-        """Initialize the visitor with source file context.
-
-        Args:
-            file_path: Path to the Python source file being analyzed.
-                      This path is stored with each FunctionInfo for traceability.
-        """
-        super().__init__()
-        # Public API: Accumulates FunctionInfo objects as functions are discovered.
-        # Each function's metadata is captured at the point of definition.
-        self.functions: list[FunctionInfo] = []
-        # Internal: Source file path to include in each FunctionInfo for traceability
-        self._file_path = file_path
-        # Internal: Tracks current scope context during traversal for building qualified names.
-        # Maintains an immutable scope stack that is replaced when entering/exiting scopes.
-        # Always starts with module scope as the root.
-        self._scope_stack: ScopeStack = create_initial_stack()
-
-    @override
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Track class context for building qualified method names.
-
-        Maintains the scope to enable proper qualified name construction for
-        methods. For nested classes, this creates names like "Outer.Inner.method".
-
-        Args:
-            node: AST node representing a class definition.
-
-        Side Effects:
-            Pushes class scope to _scope before traversing the class body,
-            then pops it after traversal completes. This ensures methods get
-            the correct qualified names.
-        """
-        self._scope_stack = add_scope(self._scope_stack, Scope(kind=ScopeKind.CLASS, name=node.name))
-        self.generic_visit(node)
-        self._scope_stack = drop_last_scope(self._scope_stack)
-
-    @override
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Extract metadata from a regular function definition.
-
-        Processes the function node to extract its signature information and adds
-        it to the functions list. Pushes the function onto the scope before
-        traversing nested functions to ensure proper qualified naming.
-
-        Args:
-            node: AST node representing a function definition.
-
-        Side Effects:
-            Adds a FunctionInfo object to self.functions.
-            Pushes function scope to _scope_stack, calls generic_visit to
-            traverse nested functions, then pops the function scope.
-        """
-        # First record the function with the current scope
-        self._process_function(node)
-        # Then push the function scope and traverse nested definitions
-        self._scope_stack = add_scope(self._scope_stack, Scope(kind=ScopeKind.FUNCTION, name=node.name))
-        self.generic_visit(node)
-        self._scope_stack = drop_last_scope(self._scope_stack)
-
-    @override
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Extract metadata from an async function definition.
-
-        Handles async functions identically to regular functions since the
-        annotation priority analysis doesn't distinguish between them. Pushes
-        the function onto the scope before traversing nested functions.
-
-        Args:
-            node: AST node representing an async function definition.
-
-        Side Effects:
-            Adds a FunctionInfo object to self.functions.
-            Pushes function scope to _scope_stack, calls generic_visit to
-            traverse nested functions, then pops the function scope.
-        """
-        # First record the function with the current scope
-        self._process_function(node)
-        # Then push the function scope and traverse nested definitions
-        self._scope_stack = add_scope(self._scope_stack, Scope(kind=ScopeKind.FUNCTION, name=node.name))
-        self.generic_visit(node)
-        self._scope_stack = drop_last_scope(self._scope_stack)
-
-    def _process_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
-        """Extract and store metadata from a function definition node.
-
-        Central processing logic for both regular and async functions. Builds the
-        qualified name, extracts parameters, checks for return annotation, and
-        creates a FunctionInfo object with all metadata.
-
-        Args:
-            node: AST node for either a regular or async function definition.
-
-        Side Effects:
-            Appends a new FunctionInfo object to self.functions.
-        """
-        qualified_name = build_qualified_name(self._scope_stack, node.name)
-        parameters = _extract_parameters(node.args)
-        has_return_annotation = node.returns is not None
-
-        function_info = FunctionInfo(
-            name=node.name,
-            qualified_name=qualified_name,
-            parameters=parameters,
-            has_return_annotation=has_return_annotation,
-            line_number=node.lineno,
-            file_path=self._file_path,
-        )
-
-        self.functions.append(function_info)
+    return FunctionInfo(
+        name=node.name,
+        qualified_name=qualified_name,
+        parameters=_extract_parameters(node.args),
+        has_return_annotation=node.returns is not None,
+        line_number=node.lineno,
+        file_path=file_path,
+    )
 
 
 def generate_synthetic_init_methods(
     known_functions: tuple[FunctionInfo, ...],
     position_index: PositionIndex,
     file_path: Path,
+    known_classes: AbstractSet[QualifiedName] | None = None,
 ) -> tuple[FunctionInfo, ...]:
     """Generate synthetic __init__ methods for classes without explicit ones.
 
@@ -249,74 +129,71 @@ def generate_synthetic_init_methods(
         known_functions: Already discovered functions to check for existing __init__
         position_index: Position-aware index containing all name bindings
         file_path: Path to the source file for the FunctionInfo objects
+        known_classes: Qualified names of all classes, if already known (e.g. from
+            NameBindingCollector.class_qualified_names); otherwise they are extracted
+            by scanning the position index
 
     Returns:
-        Tuple of synthetic FunctionInfo objects for missing __init__ methods
+        Tuple of synthetic FunctionInfo objects for missing __init__ methods, in
+        class name order
     """
-    # Build a set of existing __init__ qualified names for faster lookup
-    existing_init_names = {func.qualified_name for func in known_functions if func.name == "__init__"}
-
-    # Extract known classes from the position index
-    known_classes: set[str] = set()
-    for scope_dict in position_index.values():
-        for bindings in scope_dict.values():
-            for _, binding in bindings:
-                if binding.kind == NameBindingKind.CLASS and binding.qualified_name:
-                    known_classes.add(str(binding.qualified_name))
-
-    # Find classes that need synthetic __init__ methods
-    classes_needing_init = [
-        class_name
-        for class_name in known_classes
-        if make_qualified_name(f"{class_name}.__init__") not in existing_init_names
-    ]
-
-    # Create synthetic __init__ for each class that needs one
-    synthetic_inits: list[FunctionInfo] = []
-    for class_name in classes_needing_init:
-        synthetic_init = FunctionInfo(
-            name="__init__",
-            qualified_name=make_qualified_name(f"{class_name}.__init__"),
-            parameters=(
-                ParameterInfo(
-                    name="self",
-                    has_annotation=False,
-                    is_variadic=False,
-                    is_keyword=False,
-                ),
-            ),
-            has_return_annotation=False,
-            line_number=0,  # Line 0 indicates synthetic
-            file_path=file_path,
-        )
-        synthetic_inits.append(synthetic_init)
-
-    return tuple(synthetic_inits)
+    # Qualified names of the classes that already define __init__ ("X" for "X.__init__"),
+    # so classes can be checked without formatting an __init__ name for each one
+    classes_with_init = {
+        func.qualified_name.removesuffix(".__init__") for func in known_functions if func.name == "__init__"
+    }
+
+    # Extract known classes from the position index unless the caller already has them
+    if known_classes is None:
+        known_classes = {
+            binding.qualified_name
+            for scope_dict in position_index.values()
+            for bindings in scope_dict.values()
+            for _, binding in bindings
+            if binding.kind is NameBindingKind.CLASS and binding.qualified_name
+        }
+
+    # Create a synthetic __init__ for each class without one (sorted for a deterministic order)
+    return tuple(
+        [
+            FunctionInfo(
+                name="__init__",
+                qualified_name=make_qualified_name(f"{class_name}.__init__"),
+                parameters=_SYNTHETIC_INIT_PARAMETERS,
+                has_return_annotation=False,
+                line_number=0,  # Line 0 indicates synthetic
+                file_path=file_path,
+            )
+            for class_name in sorted(known_classes)
+            if class_name not in classes_with_init
+        ]
+    )
 
 
-def parse_function_definitions(
-    tree: ast.Module,
+def build_function_definitions(
+    function_definitions: list[tuple[QualifiedName, ast.FunctionDef | ast.AsyncFunctionDef]],
     file_path: Path,
     position_index: PositionIndex,
+    known_classes: AbstractSet[QualifiedName],
 ) -> tuple[FunctionInfo, ...]:
-    """Extract all function definitions from a parsed AST.
+    """Build function metadata from definitions already collected by NameBindingCollector.
 
-    Includes synthetic __init__ methods for classes without explicit constructors.
-    These synthetic methods have a single 'self' parameter with no annotations.
+    Reuses the (qualified_name, node) pairs gathered during name binding collection
+    instead of traversing the AST again.
 
     Args:
-        tree: Parsed AST module
+        function_definitions: (qualified_name, node) pairs in traversal order, as
+            collected in NameBindingCollector.function_definitions
         file_path: Path to the source file (for FunctionInfo objects)
         position_index: Position-aware index containing all name bindings
+        known_classes: Qualified names of all classes, as collected in
+            NameBindingCollector.class_qualified_names
 
     Returns:
-        Tuple of FunctionInfo objects containing function metadata including
-        name, qualified name, parameters, and return annotation status.
+        Tuple of FunctionInfo objects, including synthetic __init__ methods for
+        classes without explicit constructors.
     """
-    visitor = FunctionDefinitionVisitor(file_path)
-    visitor.visit(tree)
-
-    # Generate synthetic __init__ methods for classes without them
-    synthetic_inits = generate_synthetic_init_methods(tuple(visitor.functions), position_index, file_path)
-
-    return tuple(visitor.functions) + synthetic_inits
+    functions = tuple(
+        _build_function_info(node, qualified_name, file_path) for qualified_name, node in function_definitions
+    )
+    return functions + generate_synthetic_init_methods(functions, position_index, file_path, known_classes)
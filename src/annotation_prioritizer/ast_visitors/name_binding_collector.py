@@ -3,21 +3,26 @@
 This visitor collects all name bindings (imports, functions, classes, variables)
 in a single AST traversal, tracking their positions and scope context. This enables
 position-aware name resolution that correctly handles Python's shadowing semantics.
+
+The same traversal records every call together with the scope it appears in, so
+calls can be counted once all bindings are known without walking the tree again.
 """
 
 import ast
 from typing import override
 
-from annotation_prioritizer.models import NameBinding, NameBindingKind, Scope, ScopeKind, ScopeStack
-from annotation_prioritizer.scope_tracker import (
-    add_scope,
-    build_qualified_name,
-    create_initial_stack,
-    drop_last_scope,
+from annotation_prioritizer.ast_visitors.traversal import ScopeTrackingVisitor
+from annotation_prioritizer.models import (
+    NameBinding,
+    NameBindingKind,
+    QualifiedName,
+    ScopeKind,
+    ScopeStack,
 )
+from annotation_prioritizer.scope_tracker import build_qualified_name
 
 
-class NameBindingCollector(ast.NodeVisitor):
+class NameBindingCollector(ScopeTrackingVisitor):
     """Single-pass collector of all name bindings in the AST.
 
     Collects imports, function definitions, class definitions, and variable
@@ -28,59 +33,69 @@ class NameBindingCollector(ast.NodeVisitor):
         bindings: List of all name bindings found during traversal
         unresolved_variables: List of (binding, target_name) tuples for variables
             that reference other names (e.g., calc = Calculator())
+        function_definitions: List of (qualified_name, node) tuples for every function
+            definition, in traversal order, so function metadata can be extracted
+            without another pass over the tree
+        class_qualified_names: Set of qualified names of all class definitions
+        calls: List of (call, scope_stack) tuples for every call, in traversal
+            order, for counting with CallCountVisitor.count_calls()
+
+    Traversal:
+        Like CallCountVisitor, the collector is a ScopeTrackingVisitor: it dispatches
+        through a precomputed handler table and walks the tree iteratively, skipping
+        subtrees that cannot contain a definition or call.
     """
 
-    def __init__(self) -> None:
-        """Initialize the collector with empty bindings and module scope."""
-        super().__init__()
+    def __init__(self, *, postponed_annotations: bool = False) -> None:
+        """Initialize the collector with empty bindings and module scope.
+
+        Args:
+            postponed_annotations: Whether the module uses 'from __future__ import
+                annotations'. If so, annotations are never evaluated, so they are
+                not traversed and calls inside them are not recorded.
+        """
+        super().__init__(postponed_annotations=postponed_annotations)
         self.bindings: list[NameBinding] = []
         self.unresolved_variables: list[tuple[NameBinding, str]] = []
-        self._scope_stack: ScopeStack = create_initial_stack()
+        self.function_definitions: list[tuple[QualifiedName, ast.FunctionDef | ast.AsyncFunctionDef]] = []
+        self.class_qualified_names: set[QualifiedName] = set()
+        self.calls: list[tuple[ast.Call, ScopeStack]] = []
+
+    @override
+    def _record_call(self, node: ast.Call) -> None:
+        """Record a call and the scope it appears in."""
+        self.calls.append((node, self._scope_stack))
 
-    def _track_definition_and_visit_scope(
-        self,
-        node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef,
-        kind: NameBindingKind,
-        scope_kind: ScopeKind,
+    @override
+    def _enter_scope(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef, kind: ScopeKind
     ) -> None:
-        """Track a definition (function/class) and visit its scope.
+        """Track the binding a definition creates in the enclosing scope, then enter its scope."""
+        self._track_definition(node)
+        super()._enter_scope(node, kind)
+
+    def _track_definition(self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> None:
+        """Track the binding created by a function or class definition.
 
         Args:
             node: The AST node representing the definition
-            kind: The type of binding (FUNCTION or CLASS)
-            scope_kind: The type of scope to create (FUNCTION or CLASS)
         """
+        is_class = isinstance(node, ast.ClassDef)
         qualified = build_qualified_name(self._scope_stack, node.name)
         binding = NameBinding(
             name=node.name,
             line_number=node.lineno,
-            kind=kind,
+            kind=NameBindingKind.CLASS if is_class else NameBindingKind.FUNCTION,
             qualified_name=qualified,
             scope_stack=self._scope_stack,
             source_module=None,
             target_class=None,
         )
         self.bindings.append(binding)
-
-        # Continue traversal with updated scope
-        self._scope_stack = add_scope(self._scope_stack, Scope(scope_kind, node.name))
-        self.generic_visit(node)
-        self._scope_stack = drop_last_scope(self._scope_stack)
-
-    @override
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Track function definitions and their scope."""
-        self._track_definition_and_visit_scope(node, NameBindingKind.FUNCTION, ScopeKind.FUNCTION)
-
-    @override
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Track async function definitions and their scope."""
-        self._track_definition_and_visit_scope(node, NameBindingKind.FUNCTION, ScopeKind.FUNCTION)
-
-    @override
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        """Track class definitions and their scope."""
-        self._track_definition_and_visit_scope(node, NameBindingKind.CLASS, ScopeKind.CLASS)
+        if is_class:
+            self.class_qualified_names.add(qualified)
+        else:
+            self.function_definitions.append((qualified, node))
 
     @override
     def visit_Import(self, node: ast.Import) -> None:
@@ -127,8 +142,9 @@ class NameBindingCollector(ast.NodeVisitor):
             value: The value being assigned (right-hand side of assignment)
             line_number: Line number where the assignment occurs
         """
-        # Check if it's a class instantiation or reference
-        if isinstance(value, ast.Call) and isinstance(value.func, ast.Name):
+        # Check if it's a class instantiation or reference. Exact type checks, as in
+        # CallCountVisitor: the parser never produces subclasses of ast node types
+        if type(value) is ast.Call and type(value.func) is ast.Name:
             # calc = Calculator() - track for later resolution
             class_name = value.func.id
             binding = NameBinding(
@@ -143,7 +159,7 @@ class NameBindingCollector(ast.NodeVisitor):
             self.bindings.append(binding)
             self.unresolved_variables.append((binding, class_name))
 
-        elif isinstance(value, ast.Name):
+        elif type(value) is ast.Name:
             # calc = Calculator (class reference) or process = sqrt (function reference)
             ref_name = value.id
             binding = NameBinding(
@@ -170,10 +186,13 @@ class NameBindingCollector(ast.NodeVisitor):
         The target class/function is resolved later in build_position_index.
         """
         # Only handle simple single-target assignments
-        if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+        if len(node.targets) == 1 and type(node.targets[0]) is ast.Name:
             variable_name = node.targets[0].id
             self._track_variable_assignment(variable_name, node.value, node.lineno)
 
+        # Visit the assignment's expressions for the calls they contain
+        self.generic_visit(node)
+
     @override
     def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
         """Track annotated assignments like calc: Calculator = Calculator().
@@ -182,6 +201,9 @@ class NameBindingCollector(ast.NodeVisitor):
         The annotation is ignored since we resolve the actual value.
         """
         # Only handle simple single-target assignments with a value
-        if isinstance(node.target, ast.Name) and node.value is not None:
+        if type(node.target) is ast.Name and node.value is not None:
             variable_name = node.target.id
             self._track_variable_assignment(variable_name, node.value, node.lineno)
+
+        # Visit the assignment's expressions for the calls they contain
+        self.generic_visit(node)
@@ -11,6 +11,7 @@ appropriately.
 """
 
 import ast
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -35,6 +36,11 @@ def parse_ast_from_source(source: str, filename: str) -> tuple[ast.Module, str]
 def parse_ast_from_file(file_path: Path) -> tuple[ast.Module, str] | None:
     """Parse a Python file into an AST and return source code.
 
+    Results are cached in-process, keyed by the file's path and stat identity (inode,
+    size, modification and change times), so re-parsing an unchanged file returns the
+    same AST and source without touching the file again. Callers must treat the
+    returned AST as read-only, since it may be shared.
+
     Args:
         file_path: Path to the Python source file
 
@@ -42,12 +48,30 @@ def parse_ast_from_file(file_path: Path) -> tuple[ast.Module, str] | None:
         Tuple of (AST module, source code) on success, None on failure
         (file not found, syntax error, or encoding error)
     """
-    if not file_path.exists():
+    try:
+        file_stat = file_path.stat()
+    except OSError:
         return None
 
+    # ctime is included so that permission changes (which leave mtime alone)
+    # invalidate a cached read failure
+    return _parse_file_cached(
+        str(file_path), file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ctime_ns
+    )
+
+
+@lru_cache(maxsize=64)
+def _parse_file_cached(
+    file_path: str,
+    inode: int,  # noqa: ARG001 - cache key only
+    size: int,  # noqa: ARG001 - cache key only
+    mtime_ns: int,  # noqa: ARG001 - cache key only
+    ctime_ns: int,  # noqa: ARG001 - cache key only
+) -> tuple[ast.Module, str] | None:
+    """Read and parse a file; the stat arguments only serve as the cache key."""
     try:
-        source_code = file_path.read_text(encoding="utf-8")
+        source_code = Path(file_path).read_text(encoding="utf-8")
     except (OSError, UnicodeDecodeError):
         return None
 
-    return parse_ast_from_source(source_code, str(file_path))
+    return parse_ast_from_source(source_code, file_path)
@@ -0,0 +1,32 @@
+"""Detection of postponed evaluation of annotations (PEP 563).
+
+In a module starting with 'from __future__ import annotations', annotations are
+stored as strings and never evaluated, so calls written inside them are not real
+call sites. The visitors that find calls use this module to decide whether to
+skip annotation subtrees.
+"""
+
+import ast
+
+# Names of the AST fields holding annotations: the "annotation" of parameters and
+# annotated assignments, and the "returns" annotation of function definitions
+ANNOTATION_FIELDS = frozenset({"annotation", "returns"})
+
+
+def uses_postponed_annotations(tree: ast.Module) -> bool:
+    """Check whether a module has 'from __future__ import annotations'.
+
+    Args:
+        tree: Parsed AST module
+
+    Returns:
+        True if the module postpones evaluation of its annotations
+    """
+    for statement in tree.body:
+        if isinstance(statement, ast.ImportFrom) and statement.module == "__future__":
+            if any(alias.name == "annotations" for alias in statement.names):
+                return True
+        elif not (isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant)):
+            # Future imports may only follow the docstring (and other future imports)
+            return False
+    return False
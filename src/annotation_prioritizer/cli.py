@@ -29,6 +29,12 @@ def parse_args() -> argparse.Namespace:
         default=0,
         help="Filter functions with fewer than N calls (default: 0)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache analysis results in this directory and reuse them for unchanged files",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -65,7 +71,7 @@ def main() -> None:
 
     try:
         # Analyze the file (now returns AnalysisResult)
-        result = analyze_file(str(args.target))
+        result = analyze_file(str(args.target), cache_dir=args.cache_dir)
 
         # Always display unresolvable summary if there are any
         if result.unresolvable_calls:
@@ -40,7 +40,7 @@ class ScopeKind(StrEnum):
     FUNCTION = "function"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Scope:
     """Represents a scope context for building qualified names.
 
@@ -83,7 +83,7 @@ class ExecutionContext(StrEnum):
     DEFERRED = "deferred"  # Executes later when called
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NameBinding:
     """A name binding at a specific position in the code.
 
@@ -111,7 +111,7 @@ class NameBinding:
     target_class: QualifiedName | None  # For variables: class they're instances of
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ParameterInfo:
     """Information about a function parameter.
 
@@ -129,7 +129,7 @@ class ParameterInfo:
     is_keyword: bool  # True for **kwargs parameters (mutually exclusive with is_variadic)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionInfo:
     """Information about a function definition extracted from AST.
 
@@ -153,7 +153,7 @@ class FunctionInfo:
     file_path: Path  # Path to source file (as provided, can be absolute or relative)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CallCount:
     """Call count information for a function.
 
@@ -168,7 +168,7 @@ class CallCount:
     call_count: int  # Number of resolved calls (can be 0)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnnotationScore:
     """Annotation completeness scores for a function.
 
@@ -189,7 +189,7 @@ class AnnotationScore:
     total_score: float  # Weighted combination (0.0 = no annotations, 1.0 = fully annotated)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionPriority:
     """Complete priority analysis for a function.
 
@@ -204,7 +204,7 @@ class FunctionPriority:
     priority_score: float  # Final priority for annotation (higher = more urgent)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UnresolvableCall:
     """Information about a call that couldn't be resolved.
 
@@ -216,7 +216,7 @@ class UnresolvableCall:
     call_text: str  # First 50 chars of the call for context
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnalysisResult:
     """Complete result from analyzing a file.
 
@@ -117,6 +117,26 @@ def resolve_name(
     Returns:
         The most recent NameBinding, or None if not found
 
+    Raises:
+        ValueError: If scope_stack is empty
+    """
+    return resolve_name_in_scope_chain(get_scope_chain(index, scope_stack), name, line, execution_context)
+
+
+def get_scope_chain(index: PositionIndex, scope_stack: ScopeStack) -> tuple[ScopeBindings, ...]:
+    """Get the bindings of every scope a name used in scope_stack can resolve to.
+
+    Looking up the chain means building the qualified name of every enclosing
+    scope, so callers resolving many names in the same scope can compute it once
+    and use resolve_name_in_scope_chain().
+
+    Args:
+        index: The position index to search in
+        scope_stack: The scope context where names are used
+
+    Returns:
+        ScopeBindings of each scope in the chain that has bindings, innermost first
+
     Raises:
         ValueError: If scope_stack is empty
     """
@@ -124,15 +144,37 @@ def resolve_name(
         msg = "scope_stack must not be empty"
         raise ValueError(msg)
 
+    return tuple(_iterate_scopes(index, scope_stack))
+
+
+def resolve_name_in_scope_chain(
+    scope_chain: tuple[ScopeBindings, ...],
+    name: str,
+    line: int,
+    execution_context: ExecutionContext,
+) -> NameBinding | None:
+    """Resolve a name at a given position in a precomputed scope chain.
+
+    Same search as resolve_name(), for a chain from get_scope_chain().
+
+    Args:
+        scope_chain: Scope bindings from innermost to outermost scope
+        name: The name to resolve
+        line: The line number where the name is used (1-indexed)
+        execution_context: Whether code executes immediately or is deferred
+
+    Returns:
+        The most recent NameBinding, or None if not found
+    """
     # Try backward search in all scopes first
-    for scope_bindings in _iterate_scopes(index, scope_stack):
+    for scope_bindings in scope_chain:
         binding = _search_backward_in_scope(scope_bindings, name, line)
         if binding is not None:
             return binding
 
     # If in deferred context and not found, try forward search
     if execution_context == ExecutionContext.DEFERRED:
-        for scope_bindings in _iterate_scopes(index, scope_stack):
+        for scope_bindings in scope_chain:
             binding = _search_forward_in_scope(scope_bindings, name, line)
             if binding is not None:
                 return binding
@@ -256,7 +298,7 @@ def _resolve_variable_target(
         ExecutionContext.IMMEDIATE,
     )
 
-    if resolved and resolved.kind == NameBindingKind.CLASS:
+    if resolved and resolved.kind is NameBindingKind.CLASS:
         # Create NEW binding with resolved target_class
         return dataclasses.replace(binding, target_class=resolved.qualified_name)
 
@@ -171,7 +171,7 @@ def get_containing_class_qualified_name(scope_stack: ScopeStack) -> QualifiedNam
         Returns "__module__.Outer"
     """
     for i in range(len(scope_stack) - 1, -1, -1):
-        if scope_stack[i].kind == ScopeKind.CLASS:
+        if scope_stack[i].kind is ScopeKind.CLASS:
             return make_qualified_name(".".join(s.name for s in scope_stack[: i + 1]))
     return None
 
@@ -202,7 +202,7 @@ def get_execution_context(scope_stack: ScopeStack) -> ExecutionContext:
         return ExecutionContext.IMMEDIATE
     return (
         ExecutionContext.DEFERRED
-        if scope_stack[-1].kind == ScopeKind.FUNCTION
+        if scope_stack[-1].kind is ScopeKind.FUNCTION
         else ExecutionContext.IMMEDIATE
     )
 
@@ -248,15 +248,16 @@ def extract_attribute_chain(node: ast.Attribute) -> tuple[str, ...]:
     Example:
         For Outer.Inner.method, returns ("Outer", "Inner", "method")
     """
+    # Collected innermost-first, then reversed once
     parts: list[str] = [node.attr]
     current = node.value
 
     while isinstance(current, ast.Attribute):
-        parts.insert(0, current.attr)
+        parts.append(current.attr)
         current = current.value
 
     if isinstance(current, ast.Name):
-        parts.insert(0, current.id)
+        parts.append(current.id)
     else:
         # If we hit something that's not a Name or Attribute, we have an incomplete chain
         # This could happen with expressions like foo()[0].bar or (a + b).method
@@ -265,4 +266,5 @@ def extract_attribute_chain(node: ast.Attribute) -> tuple[str, ...]:
             "Complex expressions like foo()[0].bar are not currently supported."
         )
 
+    parts.reverse()
     return tuple(parts)
@@ -70,3 +70,16 @@ def calculate_annotation_score(function_info: FunctionInfo) -> AnnotationScore:
         return_score=return_score,
         total_score=total_score,
     )
+
+
+def calculate_annotation_scores(functions: tuple[FunctionInfo, ...]) -> tuple[AnnotationScore, ...]:
+    """Calculate annotation scores for many functions in one pass.
+
+    Args:
+        functions: Functions to score
+
+    Returns:
+        AnnotationScores in the same order as functions. Scores are positional rather
+        than keyed by qualified name because redefined functions share a name.
+    """
+    return tuple(map(calculate_annotation_score, functions))
@@ -5,14 +5,13 @@ from pathlib import Path
 
 from annotation_prioritizer.analyzer import analyze_ast
 from annotation_prioritizer.ast_visitors.call_counter import count_function_calls
-from annotation_prioritizer.ast_visitors.function_parser import parse_function_definitions
+from annotation_prioritizer.ast_visitors.function_parser import build_function_definitions
 from annotation_prioritizer.ast_visitors.name_binding_collector import NameBindingCollector
 from annotation_prioritizer.ast_visitors.parse_ast import parse_ast_from_file, parse_ast_from_source
 from annotation_prioritizer.models import (
     AnalysisResult,
     CallCount,
     FunctionInfo,
-    NameBindingKind,
     QualifiedName,
     UnresolvableCall,
 )
@@ -25,9 +24,18 @@ def parse_functions_from_file(file_path: Path) -> tuple[FunctionInfo, ...]:
     if not parse_result:
         return ()
 
-    tree, source_code = parse_result
-    _, position_index, _ = build_position_index_from_source(source_code)
-    return parse_function_definitions(tree, file_path, position_index)
+    tree, _ = parse_result
+    return _build_functions(tree, file_path)
+
+
+def _build_functions(tree: ast.Module, file_path: Path) -> tuple[FunctionInfo, ...]:
+    """Extract function definitions the way the analyzer does, from one collector pass."""
+    collector = NameBindingCollector()
+    collector.visit(tree)
+    position_index = build_position_index(collector.bindings, collector.unresolved_variables)
+    return build_function_definitions(
+        collector.function_definitions, file_path, position_index, collector.class_qualified_names
+    )
 
 
 def build_position_index_from_source(
@@ -51,11 +59,7 @@ def build_position_index_from_source(
     position_index = build_position_index(collector.bindings, collector.unresolved_variables)
 
     # Extract known classes for __init__ resolution
-    known_classes = {
-        binding.qualified_name
-        for binding in collector.bindings
-        if binding.kind == NameBindingKind.CLASS and binding.qualified_name
-    }
+    known_classes = collector.class_qualified_names
 
     return tree, position_index, known_classes
 
@@ -86,10 +90,7 @@ def parse_functions_from_source(source: str) -> tuple[FunctionInfo, ...]:
     Returns:
         Tuple of FunctionInfo objects
     """
-    tree = ast.parse(source)
-    file_path = Path("test.py")
-    _, position_index, _ = build_position_index_from_source(source)
-    return parse_function_definitions(tree, file_path, position_index)
+    return _build_functions(ast.parse(source), Path("test.py"))
 
 
 def analyze_source(source_code: str) -> AnalysisResult:
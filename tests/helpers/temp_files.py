@@ -18,7 +18,7 @@ def temp_python_file(content: str) -> Iterator[Path]:
 
     Example:
         with temp_python_file('def test(): pass') as path:
-            result = parse_function_definitions(path)
+            result = parse_functions_from_file(path)
             assert len(result) == 1
 
     """
@@ -0,0 +1,171 @@
+"""Integration tests for the on-disk analysis cache (tests that perform I/O operations)."""
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from annotation_prioritizer.analysis_cache import load_cached_result, make_cache_key, store_cached_result
+from annotation_prioritizer.analyzer import analyze_file
+from annotation_prioritizer.models import AnalysisResult, UnresolvableCall
+from tests.helpers.factories import make_priority
+from tests.helpers.temp_files import temp_python_file
+
+SOURCE = """
+def helper(x):
+    return x
+
+def main():
+    helper(1)
+    helper(2)
+"""
+
+
+def test_store_and_load_round_trip() -> None:
+    """A stored result is loaded back unchanged."""
+    result = AnalysisResult(
+        priorities=(make_priority("helper", call_count=2),),
+        unresolvable_calls=(UnresolvableCall(line_number=3, call_text="obj.method()"),),
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp) / "cache"
+
+        store_cached_result(cache_dir, "key", result)
+
+        assert load_cached_result(cache_dir, "key") == result
+        assert [path.name for path in cache_dir.iterdir()] == ["key"]
+
+
+def test_load_missing_entry() -> None:
+    """Missing entries and missing cache directories are cache misses."""
+    with tempfile.TemporaryDirectory() as tmp:
+        assert load_cached_result(Path(tmp), "missing") is None
+        assert load_cached_result(Path(tmp) / "no-such-dir", "missing") is None
+
+
+def test_load_corrupt_entry() -> None:
+    """Entries that do not unpickle to an AnalysisResult are cache misses."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp)
+        (cache_dir / "truncated").write_bytes(b"")
+        (cache_dir / "garbage").write_bytes(b"not a pickle")
+        store_cached_result(cache_dir, "wrong-type", ["not", "a", "result"])  # pyright: ignore[reportArgumentType]
+
+        assert load_cached_result(cache_dir, "truncated") is None
+        assert load_cached_result(cache_dir, "garbage") is None
+        assert load_cached_result(cache_dir, "wrong-type") is None
+
+
+def test_store_failure_is_ignored() -> None:
+    """Write failures leave no entry and raise no error."""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = Path(tmp)
+        result = AnalysisResult(priorities=(), unresolvable_calls=())
+
+        with patch.object(Path, "write_bytes", side_effect=OSError("disk full")):
+            store_cached_result(cache_dir, "key", result)
+
+        assert list(cache_dir.iterdir()) == []
+
+
+def test_cache_key_changes_with_file_state() -> None:
+    """The key depends on the file's path, modification time, and size."""
+    with temp_python_file(SOURCE) as file_path, temp_python_file(SOURCE) as other_path:
+        key = make_cache_key(file_path, file_path.stat())
+
+        assert make_cache_key(file_path, file_path.stat()) == key
+        assert make_cache_key(other_path, file_path.stat()) != key
+
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert make_cache_key(file_path, file_path.stat()) != key
+
+
+def test_analyze_file_uses_cache() -> None:
+    """A second analysis of an unchanged file is served from the cache."""
+    with temp_python_file(SOURCE) as file_path, tempfile.TemporaryDirectory() as cache_dir:
+        first = analyze_file(str(file_path), cache_dir=Path(cache_dir))
+
+        with patch("annotation_prioritizer.analyzer.parse_ast_from_file") as mock_parse:
+            second = analyze_file(str(file_path), cache_dir=Path(cache_dir))
+
+        mock_parse.assert_not_called()
+        assert second == first
+        assert first == analyze_file(str(file_path))
+
+
+def test_analyze_file_cache_keeps_path_as_given() -> None:
+    """A relative and an absolute path to the same file have separate cache entries."""
+    with temp_python_file(SOURCE) as file_path, tempfile.TemporaryDirectory() as cache_dir:
+        with contextlib.chdir(file_path.parent):
+            relative = analyze_file(file_path.name, cache_dir=Path(cache_dir))
+        absolute = analyze_file(str(file_path), cache_dir=Path(cache_dir))
+
+        assert relative.priorities[0].function_info.file_path == Path(file_path.name)
+        assert absolute.priorities[0].function_info.file_path == file_path
+        assert absolute == analyze_file(str(file_path))
+        assert len(list(Path(cache_dir).iterdir())) == 2
+
+
+def test_analyze_file_reanalyzes_changed_file() -> None:
+    """Editing a file invalidates its cached result."""
+    with temp_python_file(SOURCE) as file_path, tempfile.TemporaryDirectory() as cache_dir:
+        first = analyze_file(str(file_path), cache_dir=Path(cache_dir))
+
+        file_path.write_text(SOURCE + "    helper(3)\n")
+        second = analyze_file(str(file_path), cache_dir=Path(cache_dir))
+
+        assert first.priorities[0].call_count == 2
+        assert second.priorities[0].call_count == 3
+
+
+def test_analyze_file_does_not_cache_unreadable_file() -> None:
+    """A file that cannot be read is analyzed again once it can, with unchanged mtime and size."""
+    with temp_python_file(SOURCE) as file_path, tempfile.TemporaryDirectory() as cache_dir:
+        # Simulate a permission error, which later goes away without touching the file
+        with patch("annotation_prioritizer.analyzer.parse_ast_from_file", return_value=None):
+            unreadable = analyze_file(str(file_path), cache_dir=Path(cache_dir))
+        readable = analyze_file(str(file_path), cache_dir=Path(cache_dir))
+
+        assert unreadable == AnalysisResult(priorities=(), unresolvable_calls=())
+        assert readable.priorities[0].call_count == 2
+
+
+def test_analyze_file_missing_file_with_cache() -> None:
+    """Missing files produce an empty result and no cache entry."""
+    with tempfile.TemporaryDirectory() as cache_dir:
+        result = analyze_file("/nonexistent/path/to/file.py", cache_dir=Path(cache_dir))
+
+        assert result == AnalysisResult(priorities=(), unresolvable_calls=())
+        assert list(Path(cache_dir).iterdir()) == []
+
+
+def test_analyze_file_skips_store_when_file_changes_during_analysis() -> None:
+    """Results are not cached if the file changed while it was being analyzed."""
+    with temp_python_file(SOURCE) as file_path, tempfile.TemporaryDirectory() as cache_dir:
+        with patch(
+            "annotation_prioritizer.analyzer.make_cache_key", side_effect=["before", "after"]
+        ) as mock_key:
+            analyze_file(str(file_path), cache_dir=Path(cache_dir))
+
+        assert mock_key.call_count == 2
+        assert list(Path(cache_dir).iterdir()) == []
+
+
+def test_analyze_file_skips_store_when_file_deleted_during_analysis() -> None:
+    """Results are not cached if the file disappears while it is being analyzed."""
+    result = AnalysisResult(priorities=(), unresolvable_calls=())
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "module.py"
+        file_path.write_text(SOURCE)
+        cache_dir = Path(tmp) / "cache"
+
+        def analyze_and_delete(path: Path) -> AnalysisResult:
+            path.unlink()
+            return result
+
+        with patch("annotation_prioritizer.analyzer._analyze_path", side_effect=analyze_and_delete):
+            assert analyze_file(str(file_path), cache_dir=cache_dir) == result
+
+        assert not cache_dir.exists()
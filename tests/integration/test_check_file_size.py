@@ -0,0 +1,43 @@
+"""Tests for the check_file_size Claude Code hook."""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+HOOK_PATH = Path(__file__).parents[2] / ".claude" / "hooks" / "check_file_size.py"
+
+
+def run_hook(file_path: Path) -> int:
+    """Run the hook on file_path and return its exit code."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, HOOK_PATH],
+        input=json.dumps({"tool_input": {"file_path": str(file_path)}}),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.returncode
+
+
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n", "\r", "\x0c", "\x1c", "\u2028"])
+def test_large_file_warns_for_any_line_ending(line_ending: str) -> None:
+    """Files over the limit are reported whichever line endings they use."""
+    source = line_ending.join(f"x{i} = {i}" for i in range(500)) + line_ending
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "module.py"
+        file_path.write_bytes(source.encode())
+
+        assert run_hook(file_path) == 1
+
+
+def test_small_file_passes() -> None:
+    """Files under the limit pass silently."""
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "module.py"
+        file_path.write_text("x = 1\n" * 10)
+
+        assert run_hook(file_path) == 0
@@ -0,0 +1,57 @@
+"""Tests for the check_imports Claude Code hook."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HOOK_PATH = Path(__file__).parents[2] / ".claude" / "hooks" / "check_imports.py"
+
+
+def run_hook(tool_input: dict[str, str]) -> int:
+    """Run the hook with the given tool input on stdin and return its exit code."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, HOOK_PATH],
+        input=json.dumps({"tool_input": tool_input}),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.returncode
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "from . import x\n",
+        "from .foo import x\n",
+        "from .. pkg import y\n",
+        "from.foo import x\n",
+        "from..pkg import y\n",
+        "from \\\n    .foo import x\n",
+    ],
+)
+def test_relative_imports_are_blocked(content: str) -> None:
+    """Relative imports are blocked, with or without whitespace after 'from'."""
+    assert run_hook({"file_path": "src/module.py", "content": content}) == 2
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "from os import path\n",
+        "import json\n",
+        "text = 'from .foo import x'\n",
+        "# from .foo import x\n",
+    ],
+)
+def test_absolute_imports_are_allowed(content: str) -> None:
+    """Absolute imports, and relative imports in strings or comments, are allowed."""
+    assert run_hook({"file_path": "src/module.py", "content": content}) == 0
+
+
+def test_edit_new_string_is_checked() -> None:
+    """Edit operations are checked through their new_string."""
+    assert run_hook({"file_path": "src/module.py", "new_string": "from.foo import x\n"}) == 2
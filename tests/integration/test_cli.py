@@ -2,6 +2,7 @@
 
 import logging
 import tempfile
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -67,7 +68,7 @@ def test_main_successful_analysis() -> None:
 
             main()
 
-            mock_analyze.assert_called_once_with(str(file_path))
+            mock_analyze.assert_called_once_with(str(file_path), cache_dir=None)
             mock_display.assert_called_once_with(test_console, (mock_priority,))
 
 
@@ -96,11 +97,30 @@ def test_main_with_min_calls_filter() -> None:
 
             main()
 
-            mock_analyze.assert_called_once_with(str(file_path))
+            mock_analyze.assert_called_once_with(str(file_path), cache_dir=None)
             # Should be called with empty tuple due to filtering
             mock_display.assert_called_once_with(test_console, ())
 
 
+def test_main_passes_cache_dir() -> None:
+    """The --cache-dir option is forwarded to analyze_file."""
+    with (
+        temp_python_file("def test_func(): pass\n") as file_path,
+        tempfile.TemporaryDirectory() as cache_dir,
+        patch("annotation_prioritizer.cli.Console") as mock_console,
+        patch("annotation_prioritizer.cli.analyze_file") as mock_analyze,
+        patch("annotation_prioritizer.cli.display_results"),
+        patch("sys.argv", ["annotation-prioritizer", str(file_path), "--cache-dir", cache_dir]),
+        capture_console_output() as (test_console, _),
+    ):
+        mock_console.return_value = test_console
+        mock_analyze.return_value = AnalysisResult(priorities=(), unresolvable_calls=())
+
+        main()
+
+        mock_analyze.assert_called_once_with(str(file_path), cache_dir=Path(cache_dir))
+
+
 def test_main_with_unresolvable_calls() -> None:
     """Test main() with unresolvable calls displays warning."""
     with temp_python_file("def test_func(): pass\n") as file_path:
@@ -131,7 +151,7 @@ def test_main_with_unresolvable_calls() -> None:
 
             main()
 
-            mock_analyze.assert_called_once_with(str(file_path))
+            mock_analyze.assert_called_once_with(str(file_path), cache_dir=None)
             mock_unresolvable_display.assert_called_once_with(test_console, (mock_unresolvable,))
             mock_display.assert_called_once_with(test_console, (mock_priority,))
 
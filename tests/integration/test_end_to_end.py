@@ -1,6 +1,9 @@
 """End-to-end integration tests for the type annotation prioritizer."""
 
-from annotation_prioritizer.analyzer import analyze_file
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from annotation_prioritizer.analyzer import analyze_file, analyze_files
 from annotation_prioritizer.models import make_qualified_name
 from tests.helpers.temp_files import temp_python_file
 
@@ -397,3 +400,31 @@ def use_calculator():
         # parameter_score = 2/2, return_score = 1.0, total = 0.75 * 1.0 + 0.25 * 1.0 = 1.0
         assert add.annotation_score.total_score == 1.0
         assert add.call_count == 1
+
+
+def test_analyze_files_matches_analyze_file() -> None:
+    """Analyzing several files in worker processes matches analyzing each one directly."""
+    sources = [
+        "def helper(x):\n    return x\n\nhelper(1)\n",
+        "class Calculator:\n    def add(self, a: int) -> int:\n        return a\n\nCalculator().add(1)\n",
+        "def broken(\n",
+    ]
+    with ExitStack() as stack:
+        paths = [str(stack.enter_context(temp_python_file(source))) for source in sources]
+
+        results = analyze_files(paths, workers=2)
+
+        assert list(results) == paths
+        assert results == {path: analyze_file(path) for path in paths}
+
+
+def test_analyze_files_single_worker() -> None:
+    """With one worker, files are analyzed in the current process."""
+    with (
+        temp_python_file("def helper():\n    pass\n\nhelper()\n") as path,
+        patch("annotation_prioritizer.analyzer.ProcessPoolExecutor") as mock_executor,
+    ):
+        results = analyze_files([str(path), str(path)], workers=1)
+
+        mock_executor.assert_not_called()
+        assert results == {str(path): analyze_file(str(path))}
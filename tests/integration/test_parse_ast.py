@@ -2,6 +2,7 @@
 
 import ast
 from pathlib import Path
+from unittest.mock import patch
 
 from annotation_prioritizer.ast_visitors.parse_ast import parse_ast_from_file
 from tests.helpers.temp_files import temp_python_file
@@ -105,3 +106,27 @@ def test_file_read_permission_error() -> None:
         finally:
             # Restore permissions before cleanup
             file_path.chmod(0o644)
+
+
+def test_unchanged_file_parse_is_cached() -> None:
+    """Parsing an unchanged file again returns the cached AST and source."""
+    with temp_python_file("def foo():\n    pass\n") as file_path:
+        first = parse_ast_from_file(file_path)
+        with patch.object(Path, "read_text") as mock_read:
+            second = parse_ast_from_file(file_path)
+
+        mock_read.assert_not_called()
+        assert second is first
+
+
+def test_modified_file_is_reparsed() -> None:
+    """Changing a file's contents invalidates its cached parse."""
+    with temp_python_file("def foo():\n    pass\n") as file_path:
+        first = parse_ast_from_file(file_path)
+        file_path.write_text("def foo():\n    pass\n\ndef bar():\n    pass\n")
+        second = parse_ast_from_file(file_path)
+
+        assert first is not None
+        assert second is not None
+        assert len(first[0].body) == 1
+        assert len(second[0].body) == 2
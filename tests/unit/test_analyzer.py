@@ -0,0 +1,31 @@
+"""Unit tests for the analyzer module."""
+
+import ast
+
+import pytest
+
+from annotation_prioritizer.analyzer import analyze_ast
+
+SOURCE = """
+def a(x): pass
+def b(x): pass
+def c(x): pass
+def d(x: int) -> None: pass
+
+a(1)
+b(1); b(2); b(3)
+c(1); c(2)
+d(1); d(2); d(3); d(4)
+"""
+
+
+@pytest.mark.parametrize("top_k", [0, 1, 2, 4, 10])
+def test_top_k_matches_truncated_full_ranking(top_k: int) -> None:
+    """top_k returns the same leading priorities as the full ranking, in the same order."""
+    tree = ast.parse(SOURCE)
+
+    full = analyze_ast(tree, SOURCE)
+    top = analyze_ast(tree, SOURCE, top_k=top_k)
+
+    assert top.priorities == full.priorities[:top_k]
+    assert top.unresolvable_calls == full.unresolvable_calls
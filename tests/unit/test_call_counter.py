@@ -8,15 +8,20 @@ from unittest.mock import patch
 
 import pytest
 
+from annotation_prioritizer.ast_visitors import call_counter
 from annotation_prioritizer.ast_visitors.call_counter import (
     CallCountVisitor,
     UnresolvableCall,
+    count_collected_calls,
+    count_function_calls,
+    count_function_calls_by_name,
 )
+from annotation_prioritizer.ast_visitors.name_binding_collector import NameBindingCollector
 from annotation_prioritizer.iteration import first
 from annotation_prioritizer.models import ExecutionContext, make_qualified_name
-from annotation_prioritizer.scope_tracker import get_execution_context
+from annotation_prioritizer.scope_tracker import create_initial_stack, get_execution_context
 from tests.helpers.factories import make_function_info, make_parameter
-from tests.helpers.function_parsing import build_position_index_from_source
+from tests.helpers.function_parsing import build_position_index_from_source, parse_functions_from_source
 
 
 def _get_first_call_node(code: str) -> ast.Call:
@@ -264,14 +269,14 @@ unknown_function({long_args})
 
 @pytest.mark.parametrize("return_value", [None, ""])
 def test_unresolvable_call_when_source_segment_fails(return_value: str | None) -> None:
-    """Test handling when ast.get_source_segment returns None or empty string."""
+    """Test handling when the call's source segment is None or an empty string."""
     simple_code = "unknown_func()"
     call_node = _get_first_call_node(simple_code)
 
     _, position_index, known_classes = build_position_index_from_source(simple_code)
     visitor = CallCountVisitor((), position_index, known_classes, simple_code)
 
-    with patch.object(ast, "get_source_segment", return_value=return_value):
+    with patch.object(call_counter, "_source_segment", return_value=return_value):
         visitor.visit_Call(call_node)
         unresolvable_calls = visitor.get_unresolvable_calls()
 
@@ -453,3 +458,283 @@ x = 1
 
     # Empty scope stack should default to IMMEDIATE
     assert get_execution_context(visitor._scope_stack) == ExecutionContext.IMMEDIATE
+
+
+def test_count_function_calls_by_name_matches_call_count_tuples() -> None:
+    """The by-name counts agree with the CallCount tuples from count_function_calls."""
+    source = """
+def helper():
+    pass
+
+class Calculator:
+    def add(self):
+        helper()
+
+helper()
+Calculator().add()
+unknown()
+"""
+    tree, position_index, known_classes = build_position_index_from_source(source)
+    functions = parse_functions_from_source(source)
+
+    by_name, unresolvable = count_function_calls_by_name(
+        tree, functions, position_index, known_classes, source
+    )
+    call_counts, tuple_unresolvable = count_function_calls(
+        tree, functions, position_index, known_classes, source
+    )
+
+    assert by_name == {cc.function_qualified_name: cc.call_count for cc in call_counts}
+    assert by_name[make_qualified_name("__module__.helper")] == 2
+    assert unresolvable == tuple_unresolvable
+
+
+def test_visit_dispatches_directly_to_handler() -> None:
+    """Visiting a node with a handler calls that handler, not just its children."""
+    source = """
+def helper():
+    pass
+
+helper()
+"""
+    _, position_index, known_classes = build_position_index_from_source(source)
+    known_functions = parse_functions_from_source(source)
+    visitor = CallCountVisitor(known_functions, position_index, known_classes, source)
+
+    visitor.visit(_get_first_call_node(source))
+
+    assert visitor.call_counts[make_qualified_name("__module__.helper")] == 1
+
+
+def test_dispatch_table_only_includes_node_handlers() -> None:
+    """visit_* methods that don't name an AST node type are not dispatched to."""
+    source = """
+x = 1
+"""
+    _, position_index, known_classes = build_position_index_from_source(source)
+
+    class HelperVisitor(CallCountVisitor):
+        def visit_helper(self) -> None:
+            """Not a node handler: 'helper' is not an AST node type."""
+
+    visitor = HelperVisitor((), position_index, known_classes, source)
+
+    # ast.NodeVisitor's own visit_Constant compatibility shim is not a handler either
+    assert set(visitor._dispatch) == {ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef, ast.Call}
+
+
+def test_name_resolutions_cached_within_scope() -> None:
+    """Repeated resolutions of a name at one position reuse the cached binding."""
+    source = """
+def helper():
+    pass
+
+helper(helper())
+"""
+    _, position_index, known_classes = build_position_index_from_source(source)
+    visitor = CallCountVisitor((), position_index, known_classes, source)
+
+    binding = visitor._resolve_name_at_position("helper", 5)
+
+    assert binding is not None
+    assert visitor._resolve_cache == {("helper", 5): binding}
+    assert visitor._resolve_name_at_position("helper", 5) is binding
+
+
+def test_name_resolution_cache_cleared_on_scope_change() -> None:
+    """Cached resolutions are dropped when entering or leaving a scope."""
+    source = """
+def helper():
+    pass
+
+def caller():
+    helper()
+
+helper()
+"""
+    known_functions = parse_functions_from_source(source)
+    tree, position_index, known_classes = build_position_index_from_source(source)
+    caller_def = tree.body[1]
+    assert isinstance(caller_def, ast.FunctionDef)
+    visitor = CallCountVisitor(known_functions, position_index, known_classes, source)
+    visitor._resolve_cache[("helper", 7)] = None
+
+    visitor.visit(caller_def)
+
+    assert visitor._resolve_cache == {}
+    assert visitor.call_counts[make_qualified_name("__module__.helper")] == 1
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "unknown_func(1, 2)\n",
+        "x = obj.method(\n    a,\n    b,\n)\n",
+        "s = 'héllo' + f('wörld', g())\n",
+        "a = 1\r\nb = f(\r\n    2)\r\n",
+        "a = 1\rb = f(2)\r",
+        "a = 1  # form\x0cfeed\nb = f(2)\n",
+        "s = f('line\u2028separator', g())\n",
+    ],
+)
+def test_source_segment_matches_ast_get_source_segment(source: str) -> None:
+    """Call text sliced from pre-split lines matches ast.get_source_segment()."""
+    source_lines = call_counter._split_source_lines(source)
+
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Call):
+            assert call_counter._source_segment(source_lines, node) == ast.get_source_segment(source, node)
+
+
+@pytest.mark.parametrize("max_length", [5, 20, 35, 55, 1000])
+def test_source_segment_stops_joining_lines_past_max_length(max_length: int) -> None:
+    """With max_length, a multi-line segment is a prefix longer than max_length, or all of it."""
+    source = "result = compute(\n    first_argument,\n    second_argument,\n    third,\n)\n"
+    call_node = _get_first_call_node(source)
+    full_text = ast.get_source_segment(source, call_node)
+    assert full_text is not None
+
+    segment = call_counter._source_segment(call_counter._split_source_lines(source), call_node, max_length)
+
+    assert segment is not None
+    assert full_text.startswith(segment)
+    assert segment == full_text or len(segment) > max_length
+
+
+def test_source_segment_without_end_position() -> None:
+    """A node without end position information has no source segment."""
+    source = "unknown_func()"
+    call_node = _get_first_call_node(source)
+    call_node.end_lineno = None
+
+    assert call_counter._source_segment(call_counter._split_source_lines(source), call_node) is None
+
+
+def test_qualified_member_names_are_reused() -> None:
+    """Building the same member name twice returns the cached string."""
+    source = """
+class Calculator:
+    pass
+"""
+    _, position_index, known_classes = build_position_index_from_source(source)
+    visitor = CallCountVisitor((), position_index, known_classes, source)
+    base = make_qualified_name("__module__.Calculator")
+
+    first_name = visitor._qualified_member(base, "add")
+
+    assert first_name == "__module__.Calculator.add"
+    assert visitor._qualified_member(base, "add") is first_name
+
+
+def test_calls_in_annotations_counted_unless_postponed() -> None:
+    """Calls inside annotations are only counted when annotations are evaluated."""
+    definitions = """
+def make_type():
+    return int
+
+def annotated(value: make_type()) -> make_type():
+    result: make_type() = value
+    return result
+
+make_type()
+"""
+    for future_import, expected_count in (("", 4), ("from __future__ import annotations\n", 1)):
+        source = future_import + definitions
+        tree, position_index, known_classes = build_position_index_from_source(source)
+        known_functions = parse_functions_from_source(source)
+
+        call_counts, _ = count_function_calls_by_name(
+            tree, known_functions, position_index, known_classes, source
+        )
+
+        assert call_counts[make_qualified_name("__module__.make_type")] == expected_count
+
+
+@pytest.mark.parametrize(
+    ("definition", "expected_name"),
+    [
+        ("class Calculator:\n    value = helper()\n", "__module__.helper"),
+        ("async def compute():\n    helper()\n", "__module__.helper"),
+    ],
+)
+def test_visit_definition_directly(definition: str, expected_name: str) -> None:
+    """Visiting a class or async function node directly counts the calls in its body."""
+    source = f"def helper():\n    pass\n\n{definition}"
+    known_functions = parse_functions_from_source(source)
+    tree, position_index, known_classes = build_position_index_from_source(source)
+    visitor = CallCountVisitor(known_functions, position_index, known_classes, source)
+
+    visitor.visit(tree.body[1])
+
+    assert visitor.call_counts[make_qualified_name(expected_name)] == 1
+    assert visitor._scope_stack == create_initial_stack()
+
+
+def test_overridden_scope_handler_is_called() -> None:
+    """A subclass overriding a scope handler gets it called instead of inline handling."""
+    source = """
+def outer():
+    def inner():
+        pass
+"""
+    tree, position_index, known_classes = build_position_index_from_source(source)
+    visited: list[str] = []
+
+    class RecordingVisitor(CallCountVisitor):
+        @override
+        def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+            visited.append(node.name)
+            super().visit_FunctionDef(node)
+
+    visitor = RecordingVisitor((), position_index, known_classes, source)
+    visitor.visit(tree)
+
+    assert visited == ["outer", "inner"]
+    assert ast.FunctionDef not in visitor._inline_scope_kinds
+    assert ast.ClassDef in visitor._inline_scope_kinds
+
+
+def test_count_collected_calls_matches_tree_traversal() -> None:
+    """Counting calls recorded by NameBindingCollector matches visiting the tree."""
+    source = """
+def helper():
+    return 1
+
+class Calculator:
+    def add(self, x):
+        return self.scale(helper()) + unknown(x)
+
+    def scale(self, x):
+        return x
+
+calc = Calculator()
+calc.add(helper())
+Calculator.scale(calc, 2)
+missing()
+"""
+    tree, position_index, known_classes = build_position_index_from_source(source)
+    known_functions = parse_functions_from_source(source)
+    collector = NameBindingCollector()
+    collector.visit(tree)
+
+    collected = count_collected_calls(collector.calls, known_functions, position_index, known_classes, source)
+    visitor = CallCountVisitor(known_functions, position_index, known_classes, source)
+    visitor.visit(tree)
+
+    assert collected == (visitor.call_counts, visitor.get_unresolvable_calls())
+    assert collected[0][make_qualified_name("__module__.helper")] == 2
+    assert [call.call_text for call in collected[1]] == ["unknown(x)", "missing()"]
+
+
+def test_known_classes_copied_on_construction() -> None:
+    """The visitor keeps its own frozen copy of known_classes."""
+    source = """
+class Calculator:
+    pass
+"""
+    _, position_index, known_classes = build_position_index_from_source(source)
+    visitor = CallCountVisitor((), position_index, known_classes, source)
+
+    known_classes.clear()
+
+    assert visitor._known_classes == frozenset({make_qualified_name("__module__.Calculator")})
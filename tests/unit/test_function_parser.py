@@ -4,9 +4,10 @@ import ast
 from pathlib import Path
 
 from annotation_prioritizer.ast_visitors.function_parser import (
-    FunctionDefinitionVisitor,
+    build_function_definitions,
     generate_synthetic_init_methods,
 )
+from annotation_prioritizer.ast_visitors.name_binding_collector import NameBindingCollector
 from annotation_prioritizer.models import make_qualified_name
 from tests.helpers.function_parsing import build_position_index_from_source, parse_functions_from_source
 
@@ -158,9 +159,11 @@ class B:
     file_path = Path("test.py")
 
     # First get the existing functions (just B.__init__)
-    visitor = FunctionDefinitionVisitor(file_path)
-    visitor.visit(tree)
-    known_functions = tuple(visitor.functions)
+    collector = NameBindingCollector()
+    collector.visit(tree)
+    known_functions = build_function_definitions(
+        collector.function_definitions, file_path, position_index, frozenset()
+    )
 
     # Generate synthetic __init__ methods
     synthetic_inits = generate_synthetic_init_methods(known_functions, position_index, file_path)
@@ -224,3 +227,42 @@ def func_with_posonly(x, y, /, z):
     assert len(func.parameters) == 3
     param_names = [p.name for p in func.parameters]
     assert param_names == ["x", "y", "z"]
+
+
+def test_definitions_in_nested_statement_bodies() -> None:
+    """Definitions inside compound statements, handlers, and match cases are all found."""
+    source = """
+if condition:
+    def in_if(): pass
+else:
+    def in_else(): pass
+
+try:
+    def in_try(): pass
+except ValueError:
+    def in_handler(): pass
+finally:
+    def in_finally(): pass
+
+match value:
+    case 1:
+        def in_case(): pass
+
+with context():
+    class Holder:
+        def method(self): pass
+
+callback = lambda: None
+"""
+    functions = parse_functions_from_source(source)
+
+    assert [function.qualified_name for function in functions] == [
+        "__module__.in_if",
+        "__module__.in_else",
+        "__module__.in_try",
+        "__module__.in_handler",
+        "__module__.in_finally",
+        "__module__.in_case",
+        "__module__.Holder.method",
+        "__module__.Holder.__init__",
+    ]
@@ -1,6 +1,8 @@
+# pyright: reportPrivateUsage=false
 """Unit tests for NameBindingCollector."""
 
 import ast
+from typing import override
 
 import pytest
 
@@ -14,6 +16,9 @@ def test_initial_state() -> None:
 
     assert collector.bindings == []
     assert collector.unresolved_variables == []
+    assert collector.function_definitions == []
+    assert collector.class_qualified_names == set()
+    assert collector.calls == []
 
 
 def test_scope_restored_after_traversal() -> None:
@@ -456,6 +461,51 @@ def level1():
     assert collector.bindings[2].qualified_name == "__module__.level1.level2.level3"
 
 
+def test_function_definitions_collected_with_nodes() -> None:
+    """Function and async function nodes are recorded with their qualified names; classes are not."""
+    source = """
+def outer():
+    async def inner():
+        pass
+
+class Calculator:
+    def add(self):
+        pass
+"""
+    tree = ast.parse(source)
+    collector = NameBindingCollector()
+    collector.visit(tree)
+
+    assert [(name, node.name) for name, node in collector.function_definitions] == [
+        ("__module__.outer", "outer"),
+        ("__module__.outer.inner", "inner"),
+        ("__module__.Calculator.add", "add"),
+    ]
+    assert isinstance(collector.function_definitions[1][1], ast.AsyncFunctionDef)
+
+
+def test_class_qualified_names_collected() -> None:
+    """Every class definition's qualified name is collected, including nested classes."""
+    source = """
+class Outer:
+    class Inner:
+        pass
+
+def factory():
+    class Local:
+        pass
+"""
+    tree = ast.parse(source)
+    collector = NameBindingCollector()
+    collector.visit(tree)
+
+    assert collector.class_qualified_names == {
+        "__module__.Outer",
+        "__module__.Outer.Inner",
+        "__module__.factory.Local",
+    }
+
+
 def test_function_in_nested_class() -> None:
     """Functions inside nested classes track the full scope chain."""
     source = """
@@ -1112,3 +1162,105 @@ def test_assignment_patterns(source: str, expected_bindings: int, expected_unres
 
     assert len(collector.bindings) == expected_bindings
     assert len(collector.unresolved_variables) == expected_unresolved
+
+
+# Call collection tests
+
+
+def test_calls_recorded_with_scope_in_traversal_order() -> None:
+    """Every call is recorded, in source order, with the scope it appears in."""
+    source = """
+result = outer(inner())
+
+class Calculator:
+    value: int = compute()
+
+    def add(self):
+        self.helper()
+"""
+    tree = ast.parse(source)
+    collector = NameBindingCollector()
+    collector.visit(tree)
+
+    recorded = [
+        (ast.unparse(call), tuple(scope.name for scope in scope_stack))
+        for call, scope_stack in collector.calls
+    ]
+    assert recorded == [
+        ("outer(inner())", ("__module__",)),
+        ("inner()", ("__module__",)),
+        ("compute()", ("__module__", "Calculator")),
+        ("self.helper()", ("__module__", "Calculator", "add")),
+    ]
+
+
+@pytest.mark.parametrize(("postponed_annotations", "expected_calls"), [(False, 4), (True, 1)])
+def test_calls_in_annotations_skipped_when_postponed(
+    postponed_annotations: bool,  # noqa: FBT001
+    expected_calls: int,
+) -> None:
+    """Calls inside annotations are only recorded when annotations are evaluated."""
+    source = """
+def annotated(value: make_type()) -> make_type():
+    result: make_type() = value
+    return compute(result)
+"""
+    tree = ast.parse(source)
+    collector = NameBindingCollector(postponed_annotations=postponed_annotations)
+    collector.visit(tree)
+
+    assert len(collector.calls) == expected_calls
+
+
+@pytest.mark.parametrize(
+    ("definition", "expected_scope"),
+    [
+        ("class Calculator:\n    value = compute()\n", ("__module__", "Calculator")),
+        ("def process():\n    compute()\n", ("__module__", "process")),
+        ("async def fetch():\n    compute()\n", ("__module__", "fetch")),
+    ],
+)
+def test_visit_definition_directly(definition: str, expected_scope: tuple[str, ...]) -> None:
+    """Visiting a definition node directly tracks it and records the calls in its body."""
+    tree = ast.parse(definition)
+    collector = NameBindingCollector()
+    collector.visit(tree.body[0])
+
+    assert collector.bindings[0].name == expected_scope[-1]
+    assert [tuple(scope.name for scope in scope_stack) for _, scope_stack in collector.calls] == [
+        expected_scope
+    ]
+    assert len(collector._scope_stack) == 1
+
+
+def test_overridden_handlers_are_called() -> None:
+    """Subclasses overriding definition or call handlers get them called instead of inline handling."""
+    source = """
+class Calculator:
+    def add(self):
+        return helper(self.scale())
+"""
+    tree = ast.parse(source)
+    visited: list[str] = []
+
+    class RecordingCollector(NameBindingCollector):
+        @override
+        def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+            visited.append(node.name)
+            super().visit_FunctionDef(node)
+
+        @override
+        def visit_Call(self, node: ast.Call) -> None:
+            visited.append(ast.unparse(node.func))
+            super().visit_Call(node)
+
+    collector = RecordingCollector()
+    collector.visit(tree)
+    plain_collector = NameBindingCollector()
+    plain_collector.visit(tree)
+
+    assert visited == ["add", "helper", "self.scale"]
+    assert collector.bindings == plain_collector.bindings
+    assert collector.calls == plain_collector.calls
+    assert ast.FunctionDef not in collector._inline_scope_kinds
+    assert ast.ClassDef in collector._inline_scope_kinds
@@ -24,7 +24,9 @@ from annotation_prioritizer.position_index import (
     PositionIndex,
     _search_forward_in_scope,
     build_position_index,
+    get_scope_chain,
     resolve_name,
+    resolve_name_in_scope_chain,
 )
 from annotation_prioritizer.scope_tracker import scope_stack_to_qualified_name
 from tests.helpers.factories import (
@@ -912,3 +914,52 @@ class TestExecutionContextAwareResolution:
         assert binding is not None
         assert binding.line_number == 10
         assert binding.name == "helper"
+
+
+class TestScopeChain:
+    """Tests for resolving names against a precomputed scope chain."""
+
+    def test_scope_chain_innermost_first_and_skips_scopes_without_bindings(self) -> None:
+        """The chain lists scopes with bindings from innermost to outermost."""
+        function_scope = make_function_scope("foo")
+        module_binding = make_import_binding("x", "bar", line_number=5)
+        function_binding = make_variable_binding(
+            "x",
+            line_number=10,
+            scope_stack=function_scope,
+            qualified_name=make_qualified_name("__module__.foo.x"),
+        )
+        index = build_index([module_binding, function_binding])
+
+        chain = get_scope_chain(index, function_scope)
+
+        function_bindings = index[make_qualified_name("__module__.foo")]
+        module_bindings = index[make_qualified_name("__module__")]
+        assert chain == (function_bindings, module_bindings)
+        assert get_scope_chain(index, (*function_scope, Scope(ScopeKind.FUNCTION, "inner"))) == chain
+
+    def test_scope_chain_empty_scope_stack_raises_error(self) -> None:
+        """get_scope_chain raises ValueError for empty scope stack."""
+        with pytest.raises(ValueError, match="scope_stack must not be empty"):
+            get_scope_chain(build_index([]), ())
+
+    def test_resolve_in_scope_chain_matches_resolve_name(self) -> None:
+        """Resolving in a precomputed chain gives the same result as resolve_name."""
+        function_scope = make_function_scope("foo")
+        module_import = make_import_binding("x", "bar", line_number=5)
+        module_func = make_function_binding("helper", line_number=30)
+        function_binding = make_variable_binding(
+            "x",
+            line_number=10,
+            scope_stack=function_scope,
+            qualified_name=make_qualified_name("__module__.foo.x"),
+        )
+        index = build_index([module_import, module_func, function_binding])
+        chain = get_scope_chain(index, function_scope)
+
+        for name in ("x", "helper", "missing"):
+            for line in (3, 8, 15, 40):
+                for context in ExecutionContext:
+                    assert resolve_name_in_scope_chain(chain, name, line, context) == resolve_name(
+                        index, name, line, function_scope, context
+                    )
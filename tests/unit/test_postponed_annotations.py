@@ -0,0 +1,25 @@
+"""Unit tests for detecting postponed evaluation of annotations."""
+
+import ast
+
+import pytest
+
+from annotation_prioritizer.ast_visitors.postponed_annotations import uses_postponed_annotations
+
+
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        ("from __future__ import annotations\n", True),
+        ('"""Docstring."""\nfrom __future__ import annotations\n', True),
+        ("from __future__ import division, annotations\n", True),
+        ("from __future__ import division\nfrom __future__ import annotations\n", True),
+        ("from __future__ import division\n", False),
+        ("import os\nfrom __future__ import annotations\n", False),
+        ("x = 1\n", False),
+        ("", False),
+    ],
+)
+def test_uses_postponed_annotations(source: str, expected: bool) -> None:  # noqa: FBT001
+    """Only a leading 'from __future__ import annotations' postpones annotations."""
+    assert uses_postponed_annotations(ast.parse(source)) is expected
@@ -9,6 +9,7 @@ from annotation_prioritizer.scoring import (
     PARAMETERS_WEIGHT,
     RETURN_TYPE_WEIGHT,
     calculate_annotation_score,
+    calculate_annotation_scores,
     calculate_parameter_score,
     calculate_return_score,
 )
@@ -292,3 +293,18 @@ def test_both_self_and_cls_ignored() -> None:
     score = calculate_parameter_score(parameters)
     # Only x counts, 1 out of 1 annotated = 1.0
     assert score == 1.0
+
+
+def test_calculate_annotation_scores_preserves_order_and_duplicates() -> None:
+    """Batch scoring returns one score per function, in order, even for redefined names."""
+    functions = (
+        make_function_info("func", parameters=(make_parameter("x", annotated=True),)),
+        make_function_info("func", parameters=(make_parameter("x"),)),
+        make_function_info("other", has_return_annotation=True),
+    )
+
+    scores = calculate_annotation_scores(functions)
+
+    assert scores == tuple(calculate_annotation_score(function_info) for function_info in functions)
+    assert scores[0].parameter_score == 1.0
+    assert scores[1].parameter_score == 0.0
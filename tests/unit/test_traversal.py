@@ -0,0 +1,71 @@
+"""Unit tests for the iterative AST traversal helpers."""
+
+import ast
+from typing import override
+
+from annotation_prioritizer.ast_visitors.traversal import (
+    CALL_FREE_NODE_TYPES,
+    ScopeTrackingVisitor,
+    child_nodes,
+)
+from annotation_prioritizer.scope_tracker import create_initial_stack
+
+
+class CallScopeRecorder(ScopeTrackingVisitor):
+    """Records each call's function source and the names of the scopes it is made in."""
+
+    def __init__(self) -> None:
+        """Initialize with no recorded calls."""
+        super().__init__()
+        self.calls: list[tuple[str, tuple[str, ...]]] = []
+
+    @override
+    def _record_call(self, node: ast.Call) -> None:
+        self.calls.append((ast.unparse(node.func), tuple(scope.name for scope in self._scope_stack)))
+
+
+def test_child_nodes_matches_iter_child_nodes() -> None:
+    """Without skipped types or fields, child_nodes lists the same children as ast.iter_child_nodes."""
+    source = """
+@decorator
+def process(value: int = 1, *args, **kwargs) -> str:
+    return f"{value!r}" if value else [x for x in args]
+"""
+    for node in ast.walk(ast.parse(source)):
+        assert child_nodes(node, frozenset(), frozenset()) == list(ast.iter_child_nodes(node))
+
+
+def test_child_nodes_skips_types_and_fields() -> None:
+    """Children of skipped types and everything in skipped fields are left out."""
+    function = ast.parse("def process(value: int) -> str:\n    return helper(value)\n").body[0]
+
+    children = child_nodes(function, CALL_FREE_NODE_TYPES, frozenset({"returns"}))
+
+    assert [type(child) for child in children] == [ast.arguments, ast.Return]
+
+
+def test_scope_tracking_visitor_records_calls_in_their_scopes() -> None:
+    """Calls, including nested ones, are handled in source order inside the scope they appear in."""
+    source = """
+setup()
+
+class Calculator:
+    limit = compute(scale())
+
+    def add(self):
+        return helper()
+
+async def fetch():
+    await load()
+"""
+    recorder = CallScopeRecorder()
+    recorder.visit(ast.parse(source))
+
+    assert recorder.calls == [
+        ("setup", ("__module__",)),
+        ("compute", ("__module__", "Calculator")),
+        ("scale", ("__module__", "Calculator")),
+        ("helper", ("__module__", "Calculator", "add")),
+        ("load", ("__module__", "fetch")),
+    ]
+    assert recorder._scope_stack == create_initial_stack()  # pyright: ignore[reportPrivateUsage]